@@ -132,9 +132,6 @@ async def async_unload_entry(
     if hasattr(coordinator, "_hourly_update_unsub") and coordinator._hourly_update_unsub:
         coordinator._hourly_update_unsub()
         coordinator._hourly_update_unsub = None
-    if hasattr(coordinator, "_midnight_update_unsub") and coordinator._midnight_update_unsub:
-        coordinator._midnight_update_unsub()
-        coordinator._midnight_update_unsub = None
     if hasattr(coordinator, "_stop_unsub") and coordinator._stop_unsub:
         coordinator._stop_unsub()
         coordinator._stop_unsub = None
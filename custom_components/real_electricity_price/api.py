@@ -281,9 +281,9 @@ class RealElectricityPriceApiClient:
             # Reduce log noise for expected failures (tomorrow's data before publication)
             tomorrow = dt_util.now().date() + datetime.timedelta(days=1)
             if date == tomorrow:
-                _LOGGER.debug("Tomorrow's data not yet available for %s (normal before ~15:00 CET)", date.isoformat())
+                _LOGGER.debug("Tomorrow's data not yet available for %s (normal before ~15:00 CET)", date)
             else:
-                _LOGGER.warning("Failed to fetch data for %s", date.isoformat())
+                _LOGGER.warning("Failed to fetch data for %s", date)
             return None
 
     async def _create_placeholder_day_data(
@@ -33,7 +33,7 @@ async def async_setup_entry(
         )
     ]
 
-    cfg = {**entry.data, **entry.options}
+    cfg = entry.runtime_data.coordinator.merged_config
     if cfg.get(CONF_CALCULATE_CHEAP_HOURS, True):
         entities.append(
             RealElectricityPriceCalculateCheapHoursButton(
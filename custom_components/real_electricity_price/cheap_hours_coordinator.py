@@ -54,6 +54,11 @@ class CheapHoursDataUpdateCoordinator(DataUpdateCoordinator):
         # Runtime storage for UI-configurable values (to avoid config entry reloads)
         self._runtime_acceptable_price: float | None = None
 
+    @property
+    def merged_config(self) -> dict[str, Any]:
+        """Return the merged entry config cached by the main coordinator."""
+        return self.main_coordinator.merged_config
+
     def set_runtime_acceptable_price(self, value: float) -> None:
         """Set the runtime acceptable price without triggering config reload."""
         self._runtime_acceptable_price = value
@@ -63,8 +68,7 @@ class CheapHoursDataUpdateCoordinator(DataUpdateCoordinator):
         """Get the runtime acceptable price, falling back to config if not set."""
         if self._runtime_acceptable_price is not None:
             return self._runtime_acceptable_price
-        config = {**self.config_entry.data, **self.config_entry.options}
-        return config.get(CONF_ACCEPTABLE_PRICE, ACCEPTABLE_PRICE_DEFAULT)
+        return self.merged_config.get(CONF_ACCEPTABLE_PRICE, ACCEPTABLE_PRICE_DEFAULT)
 
 
     async def async_manual_update(self) -> None:
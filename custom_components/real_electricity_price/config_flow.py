@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import logging
+import re
+import string
+from collections import ChainMap
+from collections.abc import Mapping
 from datetime import time as dt_time
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -15,6 +20,7 @@ from homeassistant.helpers import selector
 
 from .const import (
     ACCEPTABLE_PRICE_DEFAULT,
+    CALCULATE_CHEAP_HOURS_DEFAULT,
     CHART_COLOR_CHEAP_CURRENT_HOUR_DEFAULT,
     CHART_COLOR_CHEAP_HOURS_DEFAULT,
     CHART_COLOR_CHEAP_PAST_HOURS_DEFAULT,
@@ -81,6 +87,7 @@ from .const import (
     OFFPEAK_STRATEGY_DEFAULT,
     OFFPEAK_STRATEGY_NIGHT_WINDOW,
     OFFPEAK_STRATEGY_NP_BLOCKS,
+    REGIONAL_HOLIDAY_CODE_DEFAULT,
     SCAN_INTERVAL_MAX,
     SCAN_INTERVAL_MIN,
     SCAN_INTERVAL_STEP,
@@ -131,6 +138,51 @@ VALID_COUNTRY_CODES = [
     "GB",
 ]
 
+# Lowercases ASCII letters and turns spaces into underscores for unique ids
+_UNIQUE_ID_TRANS = str.maketrans(
+    string.ascii_uppercase + " ", string.ascii_lowercase + "_"
+)
+
+
+# A time exactly as the TimeSelector submits it (zero-padded HH:MM:SS)
+_TIME_SELECTOR_VALUE = re.compile(r"([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]")
+
+# Selectors are stateless, so every schema shares these instances
+_FRACTION_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
+)
+_VAT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=100, step=0.1, mode="box")
+)
+_SCAN_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=SCAN_INTERVAL_MIN,
+        max=SCAN_INTERVAL_MAX,
+        step=SCAN_INTERVAL_STEP,
+        mode="box",
+    )  # 5 min to 24 hours
+)
+_COUNTRY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=VALID_COUNTRY_CODES,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+        translation_key="country_code",
+    )
+)
+_OFFPEAK_STRATEGY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"value": OFFPEAK_STRATEGY_NIGHT_WINDOW, "label": "Night Window (fixed time periods)"},
+            {"value": OFFPEAK_STRATEGY_NP_BLOCKS, "label": "Nord Pool Blocks (Off-peak 1, Peak, Off-peak 2)"},
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_TEXT_SELECTOR = selector.TextSelector()
+_BOOL_SELECTOR = selector.BooleanSelector()
+_TIME_SELECTOR = selector.TimeSelector()
+_COLOR_SELECTOR = selector.ColorRGBSelector()
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """
@@ -138,20 +190,32 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
+    # Read every input once up front; the checks below only touch locals
+    get = data.get
+    # The dropdown already yields upper-case codes; only normalize typed input
+    raw_country_code = get(CONF_COUNTRY_CODE, "")
+    country_code = (
+        raw_country_code if raw_country_code.isupper() else raw_country_code.upper()
+    )
+    vat_rate = get(CONF_VAT, 0)
+    scan_interval = get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    calculate_cheap = get(CONF_CALCULATE_CHEAP_HOURS, False)
+    has_night_tariff = get(CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT)
+    strategy = get(CONF_OFFPEAK_STRATEGY, OFFPEAK_STRATEGY_DEFAULT)
+    start_val = get(CONF_NIGHT_PRICE_START_TIME)
+    end_val = get(CONF_NIGHT_PRICE_END_TIME)
+
     # Validate country code
-    country_code = data.get(CONF_COUNTRY_CODE, "").upper()
     if country_code not in VALID_COUNTRY_CODES:
         msg = f"Country code must be one of: {', '.join(VALID_COUNTRY_CODES)}"
         raise InvalidCountryCode(msg)
 
     # Validate VAT rate
-    vat_rate = data.get(CONF_VAT, 0)
     if not 0 <= vat_rate <= 100:
         msg = "VAT rate must be between 0% and 100%"
         raise InvalidVatRate(msg)
 
     # Validate scan interval
-    scan_interval = data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     if not SCAN_INTERVAL_MIN <= scan_interval <= SCAN_INTERVAL_MAX:
         msg = (
             f"Scan interval must be between 5 minutes ({SCAN_INTERVAL_MIN} seconds) "
@@ -159,43 +223,19 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         )
         raise InvalidScanInterval(msg)
 
-    # Validate cheap hours configuration if enabled
-    calculate_cheap = data.get(CONF_CALCULATE_CHEAP_HOURS, False)
-    if calculate_cheap:
-        # No additional validation needed for cheap hours
-        pass
-
     # Handle time settings based on night tariff toggle and chosen strategy
-    has_night_tariff = data.get(CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT)
-    strategy = data.get(CONF_OFFPEAK_STRATEGY, OFFPEAK_STRATEGY_DEFAULT)
     if has_night_tariff and strategy == OFFPEAK_STRATEGY_NIGHT_WINDOW:
         # Validate TimeSelector format: require both start and end time
-        start_val = data.get(CONF_NIGHT_PRICE_START_TIME)
-        end_val = data.get(CONF_NIGHT_PRICE_END_TIME)
-
         if start_val is None or end_val is None:
-            raise InvalidTimeFormat("Night price start/end time is required")
-
-        # Extract hours from either dict {hour, minute} or string "HH:MM[:SS]"
-        try:
-            if isinstance(start_val, dict) and "hour" in start_val:
-                start_hour = int(start_val["hour"])
-            elif isinstance(start_val, str):
-                start_hour, _, _ = parse_time_string(start_val)
-            else:
-                raise InvalidTimeFormat(f"Night price start time format is invalid: {start_val}")
+            msg = "Night price start/end time is required"
+            raise InvalidTimeFormat(msg)
 
-            if isinstance(end_val, dict) and "hour" in end_val:
-                end_hour = int(end_val["hour"])
-            elif isinstance(end_val, str):
-                end_hour, _, _ = parse_time_string(end_val)
-            else:
-                raise InvalidTimeFormat(f"Night price end time format is invalid: {end_val}")
-        except ValueError as e:
-            raise InvalidTimeFormat(str(e)) from e
+        # Extract hour/minute once from either dict {hour, minute} or string "HH:MM[:SS]"
+        start_hour, start_minute = _parse_night_time(start_val, "start")
+        end_hour, end_minute = _parse_night_time(end_val, "end")
 
         # Validate hour ranges
-        if not (0 <= start_hour <= 23 and 0 <= end_hour <= 23):
+        if not 0 <= start_hour <= 23 or not 0 <= end_hour <= 23:
             msg = "Night price hours must be between 00 and 23"
             raise InvalidHourRange(msg)
 
@@ -203,6 +243,11 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         if start_hour == end_hour and end_hour != 0:
             msg = "Night price start and end times cannot be the same"
             raise InvalidNightHours(msg)
+
+        # Normalize times into dict format for consistency across consumers,
+        # reusing the values parsed above instead of parsing the strings again
+        data[CONF_NIGHT_PRICE_START_TIME] = {"hour": start_hour, "minute": start_minute}
+        data[CONF_NIGHT_PRICE_END_TIME] = {"hour": end_hour, "minute": end_minute}
     elif not has_night_tariff:
         # Night tariff is disabled — no time validation needed
         pass
@@ -214,7 +259,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK,
             CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2,
         ):
-            val = data.get(key)
+            val = get(key)
             if val is not None:
                 try:
                     float(val)
@@ -222,29 +267,6 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
                     msg = f"{key} must be a number"
                     raise InvalidTimeFormat(msg)
 
-    # Normalize times into dict format for consistency across consumers
-    def _to_dict_time(val: Any) -> dict[str, int] | None:
-        try:
-            if isinstance(val, dict) and "hour" in val and "minute" in val:
-                return {"hour": int(val["hour"]), "minute": int(val["minute"])}
-            if isinstance(val, str):
-                h, m, _ = parse_time_string(val)
-                return {"hour": h, "minute": m}
-        except Exception:
-            return None
-        return None
-
-    # night window normalization (only when applicable)
-    if has_night_tariff and strategy == OFFPEAK_STRATEGY_NIGHT_WINDOW:
-        if CONF_NIGHT_PRICE_START_TIME in data and data[CONF_NIGHT_PRICE_START_TIME] is not None:
-            norm = _to_dict_time(data[CONF_NIGHT_PRICE_START_TIME])
-            if norm is not None:
-                data[CONF_NIGHT_PRICE_START_TIME] = norm
-        if CONF_NIGHT_PRICE_END_TIME in data and data[CONF_NIGHT_PRICE_END_TIME] is not None:
-            norm = _to_dict_time(data[CONF_NIGHT_PRICE_END_TIME])
-            if norm is not None:
-                data[CONF_NIGHT_PRICE_END_TIME] = norm
-
     # Normalize color values if present
     color_fields = [
         CONF_CHART_COLOR_PAST_HOURS,
@@ -259,7 +281,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     }
     
     # Add cheap hours colors only if cheap hours calculation is enabled
-    if data.get(CONF_CALCULATE_CHEAP_HOURS, False):
+    if calculate_cheap:
         color_fields.extend([
             CONF_CHART_COLOR_CHEAP_HOURS,
             CONF_CHART_COLOR_CHEAP_CURRENT_HOUR,
@@ -287,15 +309,27 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         if field in data:
             data[field] = _ensure_color_dict(data[field], color_defaults[field])
 
-    # Test connection to Nord Pool API
+    # No API connectivity test yet; when one is added, wrap only that call
+    # and raise CannotConnect from it
+    return {"title": get(CONF_NAME, "Real Electricity Price")}
+
+
+def _parse_night_time(value: Any, label: str) -> tuple[int, int]:
+    """Parse a night window start/end value into (hour, minute)."""
     try:
-        # This would normally test actual API connectivity
-        # For now, we'll do basic validation
-        return {"title": data.get(CONF_NAME, "Real Electricity Price")}
-    except Exception as exc:
-        _LOGGER.exception("Unexpected exception: %s", exc)
-        raise CannotConnect from exc
+        if isinstance(value, Mapping) and "hour" in value:
+            return int(value["hour"]), int(value.get("minute", 0))
+        if isinstance(value, str):
+            hour, minute, _ = parse_time_string(value)
+            return hour, minute
+    except (TypeError, ValueError) as e:
+        raise InvalidTimeFormat(str(e)) from e
+
+    msg = f"Night price {label} time format is invalid: {value}"
+    raise InvalidTimeFormat(msg)
+
 
+_RGB_KEYS = frozenset(("r", "g", "b"))
 
 
 def _ensure_color_dict(
@@ -303,7 +337,7 @@ def _ensure_color_dict(
 ) -> dict[str, int]:
     """Normalize selector color values into the stored RGB dict format."""
 
-    if isinstance(color_value, dict) and {"r", "g", "b"}.issubset(color_value):
+    if isinstance(color_value, dict) and _RGB_KEYS.issubset(color_value):
         result = {
             "r": int(color_value["r"]),
             "g": int(color_value["g"]),
@@ -346,6 +380,9 @@ def _time_selector_default(value: Any, fallback: str) -> str:
         return value.strftime("%H:%M:%S")
 
     if isinstance(value, str):
+        # TimeSelector values are already HH:MM:SS; pass them straight through
+        if _TIME_SELECTOR_VALUE.fullmatch(value):
+            return value
         try:
             hour, minute, second = parse_time_string(value)
             return f"{hour:02d}:{minute:02d}:{second:02d}"
@@ -356,6 +393,239 @@ def _time_selector_default(value: Any, fallback: str) -> str:
     return f"{hour:02d}:{minute:02d}:{second:02d}"
 
 
+# Defaults for every config and options flow field, shared by all steps
+_DEFAULTS_MAP: dict[str, Any] = {
+    CONF_NAME: "Real Electricity Price",
+    CONF_GRID: GRID_DEFAULT,
+    CONF_GRID_ELECTRICITY_EXCISE_DUTY: GRID_ELECTRICITY_EXCISE_DUTY_DEFAULT,
+    CONF_GRID_RENEWABLE_ENERGY_CHARGE: GRID_RENEWABLE_ENERGY_CHARGE_DEFAULT,
+    CONF_GRID_SUPPLY_SECURITY_FEE: GRID_SUPPLY_SECURITY_FEE_DEFAULT,
+    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT: GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
+    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY: GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY_DEFAULT,
+    CONF_SUPPLIER: SUPPLIER_DEFAULT,
+    CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE: SUPPLIER_RENEWABLE_ENERGY_CHARGE_DEFAULT,
+    CONF_SUPPLIER_MARGIN: SUPPLIER_MARGIN_DEFAULT,
+    CONF_SUPPLIER_BALANCING_CAPACITY_FEE: SUPPLIER_BALANCING_CAPACITY_FEE_DEFAULT,
+    CONF_COUNTRY_CODE: COUNTRY_CODE_DEFAULT,
+    CONF_VAT: VAT_DEFAULT,
+    CONF_VAT_NORD_POOL: VAT_NORD_POOL_DEFAULT,
+    CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY: VAT_GRID_ELECTRICITY_EXCISE_DUTY_DEFAULT,
+    CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE: VAT_GRID_RENEWABLE_ENERGY_CHARGE_DEFAULT,
+    CONF_VAT_GRID_SUPPLY_SECURITY_FEE: VAT_GRID_SUPPLY_SECURITY_FEE_DEFAULT,
+    CONF_VAT_GRID_TRANSMISSION_NIGHT: VAT_GRID_TRANSMISSION_NIGHT_DEFAULT,
+    CONF_VAT_GRID_TRANSMISSION_DAY: VAT_GRID_TRANSMISSION_DAY_DEFAULT,
+    CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE: VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE_DEFAULT,
+    CONF_VAT_SUPPLIER_MARGIN: VAT_SUPPLIER_MARGIN_DEFAULT,
+    CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE: VAT_SUPPLIER_BALANCING_CAPACITY_FEE_DEFAULT,
+    CONF_HAS_NIGHT_TARIFF: HAS_NIGHT_TARIFF_DEFAULT,
+    CONF_CALCULATE_CHEAP_HOURS: CALCULATE_CHEAP_HOURS_DEFAULT,
+    CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+    CONF_OFFPEAK_STRATEGY: OFFPEAK_STRATEGY_DEFAULT,
+    CONF_NIGHT_PRICE_START_TIME: NIGHT_PRICE_START_TIME_DEFAULT,
+    CONF_NIGHT_PRICE_END_TIME: NIGHT_PRICE_END_TIME_DEFAULT,
+    CONF_NIGHT_TARIFF_SATURDAY: NIGHT_TARIFF_SATURDAY_DEFAULT,
+    CONF_NIGHT_TARIFF_SUNDAY: NIGHT_TARIFF_SUNDAY_DEFAULT,
+    CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY: NIGHT_TARIFF_PUBLIC_HOLIDAY_DEFAULT,
+    CONF_REGIONAL_HOLIDAY_CODE: REGIONAL_HOLIDAY_CODE_DEFAULT,
+    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1: GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
+    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK: GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY_DEFAULT,
+    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2: GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
+    CONF_ACCEPTABLE_PRICE: ACCEPTABLE_PRICE_DEFAULT,
+    CONF_CHART_COLOR_PAST_HOURS: CHART_COLOR_PAST_HOURS_DEFAULT,
+    CONF_CHART_COLOR_CURRENT_HOUR: CHART_COLOR_CURRENT_HOUR_DEFAULT,
+    CONF_CHART_COLOR_FUTURE_HOURS: CHART_COLOR_FUTURE_HOURS_DEFAULT,
+    CONF_CHART_COLOR_CHEAP_HOURS: CHART_COLOR_CHEAP_HOURS_DEFAULT,
+    CONF_CHART_COLOR_CHEAP_CURRENT_HOUR: CHART_COLOR_CHEAP_CURRENT_HOUR_DEFAULT,
+    CONF_CHART_COLOR_CHEAP_PAST_HOURS: CHART_COLOR_CHEAP_PAST_HOURS_DEFAULT,
+}
+
+# Options menu sections, in menu order
+_OPTIONS_SECTIONS = ("general", "pricing", "time_windows", "chart_colors")
+
+
+def _field_group(*fields: tuple[str, Any]) -> tuple[tuple[str, ...], tuple[Any, ...]]:
+    """Split (key, selector) pairs into parallel key and selector tuples."""
+    keys, selectors = zip(*fields, strict=True)
+    return keys, selectors
+
+
+# User step fields as (key, selector), in form order
+_USER_FIELDS = _field_group(
+    (CONF_NAME, _TEXT_SELECTOR),
+    # Grid parameters
+    (CONF_GRID, _TEXT_SELECTOR),
+    (CONF_GRID_ELECTRICITY_EXCISE_DUTY, _FRACTION_SELECTOR),
+    (CONF_GRID_RENEWABLE_ENERGY_CHARGE, _FRACTION_SELECTOR),
+    (CONF_GRID_SUPPLY_SECURITY_FEE, _FRACTION_SELECTOR),
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT, _FRACTION_SELECTOR),
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY, _FRACTION_SELECTOR),
+    # Supplier parameters
+    (CONF_SUPPLIER, _TEXT_SELECTOR),
+    (CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE, _FRACTION_SELECTOR),
+    (CONF_SUPPLIER_MARGIN, _FRACTION_SELECTOR),
+    (CONF_SUPPLIER_BALANCING_CAPACITY_FEE, _FRACTION_SELECTOR),
+    # Regional and tax settings
+    (CONF_COUNTRY_CODE, _COUNTRY_SELECTOR),
+    (CONF_VAT, _VAT_SELECTOR),
+    # Individual VAT controls for each price component
+    (CONF_VAT_NORD_POOL, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_SUPPLY_SECURITY_FEE, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_TRANSMISSION_NIGHT, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_TRANSMISSION_DAY, _BOOL_SELECTOR),
+    (CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE, _BOOL_SELECTOR),
+    (CONF_VAT_SUPPLIER_MARGIN, _BOOL_SELECTOR),
+    (CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE, _BOOL_SELECTOR),
+    # Night/Day tariff configuration (times collected in next step if enabled)
+    (CONF_HAS_NIGHT_TARIFF, _BOOL_SELECTOR),
+    # Cheap hours (additional step when enabled)
+    (CONF_CALCULATE_CHEAP_HOURS, _BOOL_SELECTOR),
+    # Update interval
+    (CONF_SCAN_INTERVAL, _SCAN_INTERVAL_SELECTOR),
+)
+
+# Options step fields as (key, selector), grouped by section and visibility;
+# each group is stored as parallel (keys, selectors) tuples
+_OPTIONS_GENERAL_FIELDS = _field_group(
+    (CONF_NAME, _TEXT_SELECTOR),
+    (CONF_OFFPEAK_STRATEGY, _OFFPEAK_STRATEGY_SELECTOR),
+    # Night/Day tariff configuration
+    (CONF_HAS_NIGHT_TARIFF, _BOOL_SELECTOR),
+    # Cheap hours toggle
+    (CONF_CALCULATE_CHEAP_HOURS, _BOOL_SELECTOR),
+    # Update interval
+    (CONF_SCAN_INTERVAL, _SCAN_INTERVAL_SELECTOR),
+)
+_OPTIONS_PRICING_FIELDS = _field_group(
+    # Grid parameters
+    (CONF_GRID, _TEXT_SELECTOR),
+    (CONF_GRID_ELECTRICITY_EXCISE_DUTY, _FRACTION_SELECTOR),
+    (CONF_GRID_RENEWABLE_ENERGY_CHARGE, _FRACTION_SELECTOR),
+    (CONF_GRID_SUPPLY_SECURITY_FEE, _FRACTION_SELECTOR),
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT, _FRACTION_SELECTOR),
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY, _FRACTION_SELECTOR),
+    # Supplier parameters
+    (CONF_SUPPLIER, _TEXT_SELECTOR),
+    (CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE, _FRACTION_SELECTOR),
+    (CONF_SUPPLIER_MARGIN, _FRACTION_SELECTOR),
+    (CONF_SUPPLIER_BALANCING_CAPACITY_FEE, _FRACTION_SELECTOR),
+    # Regional and tax settings
+    (CONF_COUNTRY_CODE, _COUNTRY_SELECTOR),
+    (CONF_VAT, _VAT_SELECTOR),
+    # Individual VAT controls for each price component
+    (CONF_VAT_NORD_POOL, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_SUPPLY_SECURITY_FEE, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_TRANSMISSION_NIGHT, _BOOL_SELECTOR),
+    (CONF_VAT_GRID_TRANSMISSION_DAY, _BOOL_SELECTOR),
+    (CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE, _BOOL_SELECTOR),
+    (CONF_VAT_SUPPLIER_MARGIN, _BOOL_SELECTOR),
+    (CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE, _BOOL_SELECTOR),
+)
+_OPTIONS_BLOCK_PRICE_FIELDS = _field_group(
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1, _FRACTION_SELECTOR),
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK, _FRACTION_SELECTOR),
+    (CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2, _FRACTION_SELECTOR),
+)
+_OPTIONS_HOLIDAY_FIELDS = _field_group(
+    (CONF_NIGHT_TARIFF_SATURDAY, _BOOL_SELECTOR),
+    (CONF_NIGHT_TARIFF_SUNDAY, _BOOL_SELECTOR),
+    (CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY, _BOOL_SELECTOR),
+    (CONF_REGIONAL_HOLIDAY_CODE, _TEXT_SELECTOR),
+)
+_OPTIONS_CHEAP_HOURS_FIELDS = _field_group(
+    (CONF_ACCEPTABLE_PRICE, _FRACTION_SELECTOR),
+)
+# TimeSelector and ColorRGBSelector fields need their defaults converted
+_OPTIONS_NIGHT_TIME_FIELDS = (CONF_NIGHT_PRICE_START_TIME, CONF_NIGHT_PRICE_END_TIME)
+_OPTIONS_COLOR_FIELDS = (
+    CONF_CHART_COLOR_PAST_HOURS,
+    CONF_CHART_COLOR_CURRENT_HOUR,
+    CONF_CHART_COLOR_FUTURE_HOURS,
+)
+_OPTIONS_CHEAP_COLOR_FIELDS = (
+    CONF_CHART_COLOR_CHEAP_HOURS,
+    CONF_CHART_COLOR_CHEAP_CURRENT_HOUR,
+    CONF_CHART_COLOR_CHEAP_PAST_HOURS,
+)
+
+
+def _optional_fields(
+    fields: tuple[tuple[str, ...], tuple[Any, ...]], defaults: Mapping[str, Any]
+) -> dict[vol.Optional, Any]:
+    """Return vol.Optional schema entries for a (keys, selectors) field group."""
+    keys, selectors = fields
+    return {
+        vol.Optional(key, default=defaults[key]): sel
+        for key, sel in zip(keys, selectors, strict=True)
+    }
+
+
+def _build_section_schema(
+    section: str, options_data: Mapping[str, Any], current_data: Mapping[str, Any]
+) -> vol.Schema:
+    """Build the schema for a single options menu section."""
+    # Options override entry data, which overrides the integration defaults
+    merged = ChainMap(options_data, current_data, _DEFAULTS_MAP)
+
+    if section == "general":
+        schema_dict = _optional_fields(_OPTIONS_GENERAL_FIELDS, merged)
+        # Add cheap hours fields only when enabled
+        if merged[CONF_CALCULATE_CHEAP_HOURS]:
+            schema_dict.update(_optional_fields(_OPTIONS_CHEAP_HOURS_FIELDS, merged))
+        return vol.Schema(schema_dict)
+
+    if section == "pricing":
+        return vol.Schema(_optional_fields(_OPTIONS_PRICING_FIELDS, merged))
+
+    if section == "time_windows":
+        schema_dict = {}
+        strategy = merged[CONF_OFFPEAK_STRATEGY]
+        if strategy == OFFPEAK_STRATEGY_NIGHT_WINDOW:
+            schema_dict.update(
+                {
+                    vol.Optional(
+                        key,
+                        default=_time_selector_default(
+                            merged[key], _DEFAULTS_MAP[key]
+                        ),
+                    ): _TIME_SELECTOR
+                    for key in _OPTIONS_NIGHT_TIME_FIELDS
+                }
+            )
+        elif strategy == OFFPEAK_STRATEGY_NP_BLOCKS:
+            # Show per-block transmission price fields
+            schema_dict.update(_optional_fields(_OPTIONS_BLOCK_PRICE_FIELDS, merged))
+        # Weekend/Public holiday rules for night tariff
+        schema_dict.update(_optional_fields(_OPTIONS_HOLIDAY_FIELDS, merged))
+        return vol.Schema(schema_dict)
+
+    # Chart colors are always shown; cheap-hour colors only when enabled
+    color_fields = (
+        (*_OPTIONS_COLOR_FIELDS, *_OPTIONS_CHEAP_COLOR_FIELDS)
+        if merged[CONF_CALCULATE_CHEAP_HOURS]
+        else _OPTIONS_COLOR_FIELDS
+    )
+    return vol.Schema(
+        {
+            vol.Optional(
+                key,
+                default=_color_selector_default(merged[key], _DEFAULTS_MAP[key]),
+            ): _COLOR_SELECTOR
+            for key in color_fields
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_user_schema() -> vol.Schema:
+    """Build the user step schema; it only ever shows the defaults."""
+    schema_dict = _optional_fields(_USER_FIELDS, _DEFAULTS_MAP)
+    _LOGGER.debug("Final schema has %d fields", len(schema_dict))
+    return vol.Schema(schema_dict)
+
 
 class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Real Electricity Price."""
@@ -400,7 +670,7 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=self._get_user_schema(user_input),
+            data_schema=self._get_user_schema(),
             errors=self._errors,
         )
 
@@ -420,22 +690,13 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             # Default to night window times step
             return await self.async_step_night_times()
 
+        defaults = ChainMap(self._user_data, _DEFAULTS_MAP)
         schema = vol.Schema(
             {
                 vol.Required(
                     CONF_OFFPEAK_STRATEGY,
-                    default=self._user_data.get(
-                        CONF_OFFPEAK_STRATEGY, OFFPEAK_STRATEGY_DEFAULT
-                    ),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": OFFPEAK_STRATEGY_NIGHT_WINDOW, "label": "Night Window (fixed time periods)"},
-                            {"value": OFFPEAK_STRATEGY_NP_BLOCKS, "label": "Nord Pool Blocks (Off-peak 1, Peak, Off-peak 2)"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                )
+                    default=defaults[CONF_OFFPEAK_STRATEGY],
+                ): _OFFPEAK_STRATEGY_SELECTOR
             }
         )
         return self.async_show_form(
@@ -456,14 +717,8 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 # With block strategy, skip time validation (times may be absent)
                 info = await validate_input(self.hass, merged)
-            except InvalidCountryCode:
-                self._errors["country_code"] = "invalid_country_code"
-            except InvalidVatRate:
-                self._errors["vat"] = "invalid_vat_rate"
-            except InvalidScanInterval:
-                self._errors["scan_interval"] = "invalid_scan_interval"
-            except CannotConnect:
-                self._errors["base"] = "cannot_connect"
+            except InputValidationError as exc:
+                _set_validation_error(self._errors, exc)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 self._errors["base"] = "unknown"
@@ -476,60 +731,11 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     self._user_data = merged
                     return await self.async_step_chart_colors()
 
+        defaults = ChainMap(self._user_data, _DEFAULTS_MAP)
         schema = vol.Schema(
             {
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1,
-                    default=self._user_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1,
-                        GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK,
-                    default=self._user_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK,
-                        GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2,
-                    default=self._user_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2,
-                        GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SATURDAY,
-                    default=self._user_data.get(
-                        CONF_NIGHT_TARIFF_SATURDAY, NIGHT_TARIFF_SATURDAY_DEFAULT
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SUNDAY,
-                    default=self._user_data.get(
-                        CONF_NIGHT_TARIFF_SUNDAY, NIGHT_TARIFF_SUNDAY_DEFAULT
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                    default=self._user_data.get(
-                        CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                        NIGHT_TARIFF_PUBLIC_HOLIDAY_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_REGIONAL_HOLIDAY_CODE,
-                    default=self._user_data.get(
-                        CONF_REGIONAL_HOLIDAY_CODE, ""
-                    ),
-                ): selector.TextSelector(),
+                **_optional_fields(_OPTIONS_BLOCK_PRICE_FIELDS, defaults),
+                **_optional_fields(_OPTIONS_HOLIDAY_FIELDS, defaults),
             }
         )
 
@@ -539,203 +745,11 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=self._errors,
         )
 
-    def _get_user_schema(self, user_input: dict | None = None) -> vol.Schema:
+    def _get_user_schema(self) -> vol.Schema:
         """Get the user input schema."""
-        user_input = user_input or {}
-        _LOGGER.debug(
-            f"Creating user schema (step_user) with user_input keys: {list(user_input.keys())}"
-        )
-
-        schema_dict = {
-                vol.Optional(
-                    CONF_NAME,
-                    default=user_input.get(CONF_NAME, "Real Electricity Price"),
-                ): selector.TextSelector(),
-                # Grid parameters
-                vol.Optional(
-                    CONF_GRID,
-                    default=user_input.get(CONF_GRID, GRID_DEFAULT),
-                ): selector.TextSelector(),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_EXCISE_DUTY,
-                    default=user_input.get(
-                        CONF_GRID_ELECTRICITY_EXCISE_DUTY,
-                        GRID_ELECTRICITY_EXCISE_DUTY_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_RENEWABLE_ENERGY_CHARGE,
-                    default=user_input.get(
-                        CONF_GRID_RENEWABLE_ENERGY_CHARGE,
-                        GRID_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_SUPPLY_SECURITY_FEE,
-                    default=user_input.get(
-                        CONF_GRID_SUPPLY_SECURITY_FEE,
-                        GRID_SUPPLY_SECURITY_FEE_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT,
-                    default=user_input.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT,
-                        GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY,
-                    default=user_input.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY,
-                        GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                # Supplier parameters
-                vol.Optional(
-                    CONF_SUPPLIER,
-                    default=user_input.get(CONF_SUPPLIER, SUPPLIER_DEFAULT),
-                ): selector.TextSelector(),
-                vol.Optional(
-                    CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                    default=user_input.get(
-                        CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                        SUPPLIER_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_SUPPLIER_MARGIN,
-                    default=user_input.get(
-                        CONF_SUPPLIER_MARGIN,
-                        SUPPLIER_MARGIN_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_SUPPLIER_BALANCING_CAPACITY_FEE,
-                    default=user_input.get(
-                        CONF_SUPPLIER_BALANCING_CAPACITY_FEE,
-                        SUPPLIER_BALANCING_CAPACITY_FEE_DEFAULT,
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                # Regional and tax settings
-                vol.Optional(
-                    CONF_COUNTRY_CODE,
-                    default=user_input.get(CONF_COUNTRY_CODE, COUNTRY_CODE_DEFAULT),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=VALID_COUNTRY_CODES,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                        translation_key="country_code",
-                    )
-                ),
-                vol.Optional(
-                    CONF_VAT,
-                    default=user_input.get(CONF_VAT, VAT_DEFAULT),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=100, step=0.1, mode="box")
-                ),
-                # Individual VAT controls for each price component
-                vol.Optional(
-                    CONF_VAT_NORD_POOL,
-                    default=user_input.get(CONF_VAT_NORD_POOL, VAT_NORD_POOL_DEFAULT),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY,
-                    default=user_input.get(
-                        CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY,
-                        VAT_GRID_ELECTRICITY_EXCISE_DUTY_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE,
-                    default=user_input.get(
-                        CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE,
-                        VAT_GRID_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_SUPPLY_SECURITY_FEE,
-                    default=user_input.get(
-                        CONF_VAT_GRID_SUPPLY_SECURITY_FEE,
-                        VAT_GRID_SUPPLY_SECURITY_FEE_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_TRANSMISSION_NIGHT,
-                    default=user_input.get(
-                        CONF_VAT_GRID_TRANSMISSION_NIGHT,
-                        VAT_GRID_TRANSMISSION_NIGHT_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_TRANSMISSION_DAY,
-                    default=user_input.get(
-                        CONF_VAT_GRID_TRANSMISSION_DAY,
-                        VAT_GRID_TRANSMISSION_DAY_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                    default=user_input.get(
-                        CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                        VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_SUPPLIER_MARGIN,
-                    default=user_input.get(
-                        CONF_VAT_SUPPLIER_MARGIN, VAT_SUPPLIER_MARGIN_DEFAULT
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE,
-                    default=user_input.get(
-                        CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE,
-                        VAT_SUPPLIER_BALANCING_CAPACITY_FEE_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                # Night/Day tariff configuration (times collected in next step if enabled)
-                vol.Optional(
-                    CONF_HAS_NIGHT_TARIFF,
-                    default=user_input.get(CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT),
-                ): selector.BooleanSelector(),
-                # Cheap hours (additional step when enabled)
-                vol.Optional(
-                    CONF_CALCULATE_CHEAP_HOURS,
-                    default=user_input.get(CONF_CALCULATE_CHEAP_HOURS, True),
-                ): selector.BooleanSelector(),
-                # Update interval
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=SCAN_INTERVAL_MIN,
-                        max=SCAN_INTERVAL_MAX,
-                        step=SCAN_INTERVAL_STEP,
-                        mode="box",
-                    )  # 5 min to 24 hours
-                ),
-        }
-
-        _LOGGER.debug("Final schema has %d fields", len(schema_dict))
-        return vol.Schema(schema_dict)
+        # The user step is only shown before any input was submitted, so the
+        # schema always carries the defaults and is built once
+        return _build_user_schema()
 
     async def async_step_night_times(
         self, user_input: dict | None = None
@@ -756,49 +770,16 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_chart_colors()
 
         # Show time selectors
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_NIGHT_PRICE_START_TIME,
-                    default=_time_selector_default(
-                        self._user_data.get(CONF_NIGHT_PRICE_START_TIME),
-                        NIGHT_PRICE_START_TIME_DEFAULT,
-                    ),
-                ): selector.TimeSelector(),
-                vol.Optional(
-                    CONF_NIGHT_PRICE_END_TIME,
-                    default=_time_selector_default(
-                        self._user_data.get(CONF_NIGHT_PRICE_END_TIME),
-                        NIGHT_PRICE_END_TIME_DEFAULT,
-                    ),
-                ): selector.TimeSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SATURDAY,
-                    default=self._user_data.get(
-                        CONF_NIGHT_TARIFF_SATURDAY, NIGHT_TARIFF_SATURDAY_DEFAULT
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SUNDAY,
-                    default=self._user_data.get(
-                        CONF_NIGHT_TARIFF_SUNDAY, NIGHT_TARIFF_SUNDAY_DEFAULT
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                    default=self._user_data.get(
-                        CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                        NIGHT_TARIFF_PUBLIC_HOLIDAY_DEFAULT,
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_REGIONAL_HOLIDAY_CODE,
-                    default=self._user_data.get(
-                        CONF_REGIONAL_HOLIDAY_CODE, ""
-                    ),
-                ): selector.TextSelector(),
-            }
-        )
+        defaults = ChainMap(self._user_data, _DEFAULTS_MAP)
+        schema_dict = {
+            vol.Optional(
+                key,
+                default=_time_selector_default(defaults[key], _DEFAULTS_MAP[key]),
+            ): _TIME_SELECTOR
+            for key in _OPTIONS_NIGHT_TIME_FIELDS
+        }
+        schema_dict.update(_optional_fields(_OPTIONS_HOLIDAY_FIELDS, defaults))
+        schema = vol.Schema(schema_dict)
 
         return self.async_show_form(
             step_id="night_times",
@@ -817,20 +798,8 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             merged = {**self._user_data, **user_input}
             try:
                 info = await validate_input(self.hass, merged)
-            except InvalidCountryCode:
-                self._errors["country_code"] = "invalid_country_code"
-            except InvalidVatRate:
-                self._errors["vat"] = "invalid_vat_rate"
-            except InvalidScanInterval:
-                self._errors["scan_interval"] = "invalid_scan_interval"
-            except InvalidHourRange:
-                self._errors["base"] = "invalid_hour_range"
-            except InvalidNightHours:
-                self._errors["base"] = "invalid_night_hours"
-            except InvalidTimeFormat:
-                self._errors["base"] = "invalid_time_format"
-            except CannotConnect:
-                self._errors["base"] = "cannot_connect"
+            except InputValidationError as exc:
+                _set_validation_error(self._errors, exc)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 self._errors["base"] = "unknown"
@@ -840,66 +809,35 @@ class RealElectricityPriceFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 supplier = merged.get(CONF_SUPPLIER, SUPPLIER_DEFAULT)
                 country = merged.get(CONF_COUNTRY_CODE, COUNTRY_CODE_DEFAULT)
 
-                unique_id = f"real_electricity_price_{name}_{grid}_{supplier}_{country}".lower().replace(
-                    " ", "_"
-                )
+                unique_id = f"real_electricity_price_{name}_{grid}_{supplier}_{country}"
+                # Lowercase and replace spaces in one pass; non-ASCII names still
+                # need full Unicode lowercasing
+                if unique_id.isascii():
+                    unique_id = unique_id.translate(_UNIQUE_ID_TRANS)
+                else:
+                    unique_id = unique_id.lower().replace(" ", "_")
                 await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
 
                 return self.async_create_entry(title=info["title"], data=merged)
 
-        # Create base schema with always-present colors
-        schema_dict = {
-                vol.Optional(
-                    CONF_CHART_COLOR_PAST_HOURS,
-                    default=_color_selector_default(
-                        self._user_data.get(CONF_CHART_COLOR_PAST_HOURS),
-                        CHART_COLOR_PAST_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_CURRENT_HOUR,
-                    default=_color_selector_default(
-                        self._user_data.get(CONF_CHART_COLOR_CURRENT_HOUR),
-                        CHART_COLOR_CURRENT_HOUR_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_FUTURE_HOURS,
-                    default=_color_selector_default(
-                        self._user_data.get(CONF_CHART_COLOR_FUTURE_HOURS),
-                        CHART_COLOR_FUTURE_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-        }
-
-        # Only add cheap hours colors if cheap hours calculation is enabled
+        # Always-present colors, plus cheap hours colors when that is enabled
+        color_fields = _OPTIONS_COLOR_FIELDS
         if self._user_data.get(CONF_CALCULATE_CHEAP_HOURS, False):
-            schema_dict.update({
-                vol.Optional(
-                    CONF_CHART_COLOR_CHEAP_HOURS,
-                    default=_color_selector_default(
-                        self._user_data.get(CONF_CHART_COLOR_CHEAP_HOURS),
-                        CHART_COLOR_CHEAP_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_CHEAP_CURRENT_HOUR,
-                    default=_color_selector_default(
-                        self._user_data.get(CONF_CHART_COLOR_CHEAP_CURRENT_HOUR),
-                        CHART_COLOR_CHEAP_CURRENT_HOUR_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
+            color_fields = (*color_fields, *_OPTIONS_CHEAP_COLOR_FIELDS)
+
+        defaults = ChainMap(self._user_data, _DEFAULTS_MAP)
+        schema = vol.Schema(
+            {
                 vol.Optional(
-                    CONF_CHART_COLOR_CHEAP_PAST_HOURS,
+                    key,
                     default=_color_selector_default(
-                        self._user_data.get(CONF_CHART_COLOR_CHEAP_PAST_HOURS),
-                        CHART_COLOR_CHEAP_PAST_HOURS_DEFAULT,
+                        defaults[key], _DEFAULTS_MAP[key]
                     ),
-                ): selector.ColorRGBSelector(),
-            })
-        
-        schema = vol.Schema(schema_dict)
+                ): _COLOR_SELECTOR
+                for key in color_fields
+            }
+        )
 
         return self.async_show_form(
             step_id="chart_colors",
@@ -920,614 +858,131 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_init(
         self, user_input: dict | None = None
     ) -> config_entries.ConfigFlowResult:
-        """Manage the options."""
+        """Show the options sections menu."""
+        has_night_tariff = ChainMap(
+            self._config_entry.options, self._config_entry.data, _DEFAULTS_MAP
+        )[CONF_HAS_NIGHT_TARIFF]
+
+        # Time windows only apply while the night tariff is enabled
+        menu_options = [
+            section
+            for section in _OPTIONS_SECTIONS
+            if has_night_tariff or section != "time_windows"
+        ]
+        return self.async_show_menu(step_id="init", menu_options=menu_options)
+
+    async def async_step_general(
+        self, user_input: dict | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage name, strategy, feature toggles and update interval."""
+        return await self._async_step_section("general", user_input)
+
+    async def async_step_pricing(
+        self, user_input: dict | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage grid, supplier and VAT pricing parameters."""
+        return await self._async_step_section("pricing", user_input)
+
+    async def async_step_time_windows(
+        self, user_input: dict | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage off-peak windows and holiday rules."""
+        return await self._async_step_section("time_windows", user_input)
+
+    async def async_step_chart_colors(
+        self, user_input: dict | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage chart colors."""
+        return await self._async_step_section("chart_colors", user_input)
+
+    async def _async_step_section(
+        self, section: str, user_input: dict | None
+    ) -> config_entries.ConfigFlowResult:
+        """Show or save a single options section."""
         self._errors = {}
 
+        # Get current config values
+        current_data = self._config_entry.data
+        options_data = self._config_entry.options
+
         if user_input is not None:
+            # Validate the section together with the rest of the configuration
+            merged = {**_DEFAULTS_MAP, **current_data, **options_data, **user_input}
             try:
-                await validate_input(self.hass, user_input)
-            except InvalidCountryCode:
-                self._errors["country_code"] = "invalid_country_code"
-            except InvalidVatRate:
-                self._errors["vat"] = "invalid_vat_rate"
-            except InvalidScanInterval:
-                self._errors["scan_interval"] = "invalid_scan_interval"
-            except InvalidHourRange:
-                self._errors["base"] = "invalid_hour_range"
-            except InvalidNightHours:
-                self._errors["base"] = "invalid_night_hours"
-            except InvalidTimeFormat:
-                self._errors["base"] = "invalid_time_format"
-            except CannotConnect:
-                self._errors["base"] = "cannot_connect"
+                await validate_input(self.hass, merged)
+            except InputValidationError as exc:
+                _set_validation_error(self._errors, exc)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 self._errors["base"] = "unknown"
             else:
-                return self.async_create_entry(title="", data=user_input)
-
-        # Get current config values
-        current_data = self._config_entry.data
-        options_data = self._config_entry.options
+                # validate_input normalizes times and colors in place
+                options = dict(options_data)
+                options.update({key: merged[key] for key in user_input})
+                return self.async_create_entry(title="", data=options)
 
         return self.async_show_form(
-            step_id="init",
-            data_schema=self._get_options_schema(current_data, options_data),
+            step_id=section,
+            data_schema=_build_section_schema(section, options_data, current_data),
             errors=self._errors,
         )
 
-    def _get_options_schema(self, current_data: dict, options_data: dict) -> vol.Schema:
-        """Get the options schema."""
-        # Check if night tariff is enabled to conditionally show fields
-        has_night_tariff = options_data.get(
-            CONF_HAS_NIGHT_TARIFF,
-            current_data.get(CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT),
-        )
-        strategy = options_data.get(
-            CONF_OFFPEAK_STRATEGY,
-            current_data.get(CONF_OFFPEAK_STRATEGY, OFFPEAK_STRATEGY_DEFAULT),
-        )
-        calculate_cheap = options_data.get(
-            CONF_CALCULATE_CHEAP_HOURS,
-            current_data.get(CONF_CALCULATE_CHEAP_HOURS, True),
-        )
 
-        schema_dict = {
-                vol.Optional(
-                    CONF_NAME,
-                    default=options_data.get(
-                        CONF_NAME, current_data.get(CONF_NAME, "Real Electricity Price")
-                    ),
-                ): selector.TextSelector(),
-                vol.Optional(
-                    CONF_OFFPEAK_STRATEGY,
-                    default=options_data.get(
-                        CONF_OFFPEAK_STRATEGY,
-                        current_data.get(
-                            CONF_OFFPEAK_STRATEGY, OFFPEAK_STRATEGY_DEFAULT
-                        ),
-                    ),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": OFFPEAK_STRATEGY_NIGHT_WINDOW, "label": "Night Window (fixed time periods)"},
-                            {"value": OFFPEAK_STRATEGY_NP_BLOCKS, "label": "Nord Pool Blocks (Off-peak 1, Peak, Off-peak 2)"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                # Grid parameters
-                vol.Optional(
-                    CONF_GRID,
-                    default=options_data.get(
-                        CONF_GRID, current_data.get(CONF_GRID, GRID_DEFAULT)
-                    ),
-                ): selector.TextSelector(),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_EXCISE_DUTY,
-                    default=options_data.get(
-                        CONF_GRID_ELECTRICITY_EXCISE_DUTY,
-                        current_data.get(
-                            CONF_GRID_ELECTRICITY_EXCISE_DUTY,
-                            GRID_ELECTRICITY_EXCISE_DUTY_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_RENEWABLE_ENERGY_CHARGE,
-                    default=options_data.get(
-                        CONF_GRID_RENEWABLE_ENERGY_CHARGE,
-                        current_data.get(
-                            CONF_GRID_RENEWABLE_ENERGY_CHARGE,
-                            GRID_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_SUPPLY_SECURITY_FEE,
-                    default=options_data.get(
-                        CONF_GRID_SUPPLY_SECURITY_FEE,
-                        current_data.get(
-                            CONF_GRID_SUPPLY_SECURITY_FEE,
-                            GRID_SUPPLY_SECURITY_FEE_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT,
-                    default=options_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT,
-                        current_data.get(
-                            CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT,
-                            GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY,
-                    default=options_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY,
-                        current_data.get(
-                            CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY,
-                            GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                # Supplier parameters
-                vol.Optional(
-                    CONF_SUPPLIER,
-                    default=options_data.get(
-                        CONF_SUPPLIER, current_data.get(CONF_SUPPLIER, SUPPLIER_DEFAULT)
-                    ),
-                ): selector.TextSelector(),
-                vol.Optional(
-                    CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                    default=options_data.get(
-                        CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                        current_data.get(
-                            CONF_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                            SUPPLIER_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_SUPPLIER_MARGIN,
-                    default=options_data.get(
-                        CONF_SUPPLIER_MARGIN,
-                        current_data.get(
-                            CONF_SUPPLIER_MARGIN,
-                            SUPPLIER_MARGIN_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_SUPPLIER_BALANCING_CAPACITY_FEE,
-                    default=options_data.get(
-                        CONF_SUPPLIER_BALANCING_CAPACITY_FEE,
-                        current_data.get(
-                            CONF_SUPPLIER_BALANCING_CAPACITY_FEE,
-                            SUPPLIER_BALANCING_CAPACITY_FEE_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                # Regional and tax settings
-                vol.Optional(
-                    CONF_COUNTRY_CODE,
-                    default=options_data.get(
-                        CONF_COUNTRY_CODE,
-                        current_data.get(CONF_COUNTRY_CODE, COUNTRY_CODE_DEFAULT),
-                    ),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=VALID_COUNTRY_CODES,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                        translation_key="country_code",
-                    )
-                ),
-                vol.Optional(
-                    CONF_VAT,
-                    default=options_data.get(
-                        CONF_VAT, current_data.get(CONF_VAT, VAT_DEFAULT)
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=100, step=0.1, mode="box")
-                ),
-                # Individual VAT controls for each price component
-                vol.Optional(
-                    CONF_VAT_NORD_POOL,
-                    default=options_data.get(
-                        CONF_VAT_NORD_POOL,
-                        current_data.get(CONF_VAT_NORD_POOL, VAT_NORD_POOL_DEFAULT),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY,
-                    default=options_data.get(
-                        CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY,
-                        current_data.get(
-                            CONF_VAT_GRID_ELECTRICITY_EXCISE_DUTY,
-                            VAT_GRID_ELECTRICITY_EXCISE_DUTY_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE,
-                    default=options_data.get(
-                        CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE,
-                        current_data.get(
-                            CONF_VAT_GRID_RENEWABLE_ENERGY_CHARGE,
-                            VAT_GRID_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_SUPPLY_SECURITY_FEE,
-                    default=options_data.get(
-                        CONF_VAT_GRID_SUPPLY_SECURITY_FEE,
-                        current_data.get(
-                            CONF_VAT_GRID_SUPPLY_SECURITY_FEE,
-                            VAT_GRID_SUPPLY_SECURITY_FEE_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_TRANSMISSION_NIGHT,
-                    default=options_data.get(
-                        CONF_VAT_GRID_TRANSMISSION_NIGHT,
-                        current_data.get(
-                            CONF_VAT_GRID_TRANSMISSION_NIGHT,
-                            VAT_GRID_TRANSMISSION_NIGHT_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_GRID_TRANSMISSION_DAY,
-                    default=options_data.get(
-                        CONF_VAT_GRID_TRANSMISSION_DAY,
-                        current_data.get(
-                            CONF_VAT_GRID_TRANSMISSION_DAY,
-                            VAT_GRID_TRANSMISSION_DAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                    default=options_data.get(
-                        CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                        current_data.get(
-                            CONF_VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE,
-                            VAT_SUPPLIER_RENEWABLE_ENERGY_CHARGE_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_SUPPLIER_MARGIN,
-                    default=options_data.get(
-                        CONF_VAT_SUPPLIER_MARGIN,
-                        current_data.get(
-                            CONF_VAT_SUPPLIER_MARGIN, VAT_SUPPLIER_MARGIN_DEFAULT
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE,
-                    default=options_data.get(
-                        CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE,
-                        current_data.get(
-                            CONF_VAT_SUPPLIER_BALANCING_CAPACITY_FEE,
-                            VAT_SUPPLIER_BALANCING_CAPACITY_FEE_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                # Night/Day tariff configuration
-                vol.Optional(
-                    CONF_HAS_NIGHT_TARIFF,
-                    default=options_data.get(
-                        CONF_HAS_NIGHT_TARIFF,
-                        current_data.get(CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT),
-                    ),
-                ): selector.BooleanSelector(),
-                # Cheap hours toggle
-                vol.Optional(
-                    CONF_CALCULATE_CHEAP_HOURS,
-                    default=options_data.get(
-                        CONF_CALCULATE_CHEAP_HOURS,
-                        current_data.get(CONF_CALCULATE_CHEAP_HOURS, True),
-                    ),
-                ): selector.BooleanSelector(),
-                # Update interval
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=options_data.get(
-                        CONF_SCAN_INTERVAL,
-                        current_data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=SCAN_INTERVAL_MIN,
-                        max=SCAN_INTERVAL_MAX,
-                        step=SCAN_INTERVAL_STEP,
-                        mode="box",
-                    )  # 5 min to 24 hours
-                ),
-        }
-
-        # Only add time fields when night tariff is enabled; omit entirely when disabled
-        if has_night_tariff and strategy == OFFPEAK_STRATEGY_NIGHT_WINDOW:
-            schema_dict.update({
-                vol.Optional(
-                    CONF_NIGHT_PRICE_START_TIME,
-                    default=_time_selector_default(
-                        options_data.get(
-                            CONF_NIGHT_PRICE_START_TIME,
-                            current_data.get(CONF_NIGHT_PRICE_START_TIME),
-                        ),
-                        NIGHT_PRICE_START_TIME_DEFAULT,
-                    ),
-                ): selector.TimeSelector(),
-                vol.Optional(
-                    CONF_NIGHT_PRICE_END_TIME,
-                    default=_time_selector_default(
-                        options_data.get(
-                            CONF_NIGHT_PRICE_END_TIME,
-                            current_data.get(CONF_NIGHT_PRICE_END_TIME),
-                        ),
-                        NIGHT_PRICE_END_TIME_DEFAULT,
-                    ),
-                ): selector.TimeSelector(),
-            })
-            # Weekend/Public holiday rules for night tariff
-            schema_dict.update({
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SATURDAY,
-                    default=options_data.get(
-                        CONF_NIGHT_TARIFF_SATURDAY,
-                        current_data.get(
-                            CONF_NIGHT_TARIFF_SATURDAY,
-                            NIGHT_TARIFF_SATURDAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SUNDAY,
-                    default=options_data.get(
-                        CONF_NIGHT_TARIFF_SUNDAY,
-                        current_data.get(
-                            CONF_NIGHT_TARIFF_SUNDAY,
-                            NIGHT_TARIFF_SUNDAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                    default=options_data.get(
-                        CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                        current_data.get(
-                            CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                            NIGHT_TARIFF_PUBLIC_HOLIDAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_REGIONAL_HOLIDAY_CODE,
-                    default=options_data.get(
-                        CONF_REGIONAL_HOLIDAY_CODE,
-                        current_data.get(CONF_REGIONAL_HOLIDAY_CODE, ""),
-                    ),
-                ): selector.TextSelector(),
-            })
-        elif has_night_tariff and strategy == OFFPEAK_STRATEGY_NP_BLOCKS:
-            # Show per-block transmission price fields and weekend/holiday settings
-            schema_dict.update({
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1,
-                    default=options_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1,
-                        current_data.get(
-                            CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK1,
-                            GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK,
-                    default=options_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK,
-                        current_data.get(
-                            CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_PEAK,
-                            GRID_ELECTRICITY_TRANSMISSION_PRICE_DAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2,
-                    default=options_data.get(
-                        CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2,
-                        current_data.get(
-                            CONF_GRID_ELECTRICITY_TRANSMISSION_PRICE_OFFPEAK2,
-                            GRID_ELECTRICITY_TRANSMISSION_PRICE_NIGHT_DEFAULT,
-                        ),
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=1, step="any", mode="box")
-                ),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SATURDAY,
-                    default=options_data.get(
-                        CONF_NIGHT_TARIFF_SATURDAY,
-                        current_data.get(
-                            CONF_NIGHT_TARIFF_SATURDAY, NIGHT_TARIFF_SATURDAY_DEFAULT
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_SUNDAY,
-                    default=options_data.get(
-                        CONF_NIGHT_TARIFF_SUNDAY,
-                        current_data.get(
-                            CONF_NIGHT_TARIFF_SUNDAY, NIGHT_TARIFF_SUNDAY_DEFAULT
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                    default=options_data.get(
-                        CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                        current_data.get(
-                            CONF_NIGHT_TARIFF_PUBLIC_HOLIDAY,
-                            NIGHT_TARIFF_PUBLIC_HOLIDAY_DEFAULT,
-                        ),
-                    ),
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_REGIONAL_HOLIDAY_CODE,
-                    default=options_data.get(
-                        CONF_REGIONAL_HOLIDAY_CODE,
-                        current_data.get(CONF_REGIONAL_HOLIDAY_CODE, ""),
-                    ),
-                ): selector.TextSelector(),
-            })
-        else:
-            _LOGGER.debug("Night tariff disabled in options; omitting night time fields")
-
-        # Add cheap hours fields only when enabled
-        if calculate_cheap:
-            schema_dict.update(
-                {
-                    vol.Optional(
-                        CONF_ACCEPTABLE_PRICE,
-                        default=options_data.get(
-                            CONF_ACCEPTABLE_PRICE,
-                            current_data.get(
-                                CONF_ACCEPTABLE_PRICE,
-                                ACCEPTABLE_PRICE_DEFAULT,
-                            ),
-                        ),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0, max=1, step="any", mode="box"
-                        )
-                    ),
-                }
-            )
-
-        # Always add chart color options
-        schema_dict.update(
-            {
-                vol.Optional(
-                    CONF_CHART_COLOR_PAST_HOURS,
-                    default=_color_selector_default(
-                        options_data.get(
-                            CONF_CHART_COLOR_PAST_HOURS,
-                            current_data.get(
-                                CONF_CHART_COLOR_PAST_HOURS,
-                                CHART_COLOR_PAST_HOURS_DEFAULT,
-                            ),
-                        ),
-                        CHART_COLOR_PAST_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_CURRENT_HOUR,
-                    default=_color_selector_default(
-                        options_data.get(
-                            CONF_CHART_COLOR_CURRENT_HOUR,
-                            current_data.get(
-                                CONF_CHART_COLOR_CURRENT_HOUR,
-                                CHART_COLOR_CURRENT_HOUR_DEFAULT,
-                            ),
-                        ),
-                        CHART_COLOR_CURRENT_HOUR_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_FUTURE_HOURS,
-                    default=_color_selector_default(
-                        options_data.get(
-                            CONF_CHART_COLOR_FUTURE_HOURS,
-                            current_data.get(
-                                CONF_CHART_COLOR_FUTURE_HOURS,
-                                CHART_COLOR_FUTURE_HOURS_DEFAULT,
-                            ),
-                        ),
-                        CHART_COLOR_FUTURE_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-            }
-        )
-
-        # Add cheap-hour colors only when cheap-hour calculation is enabled
-        if calculate_cheap:
-            schema_dict = {
-                **schema_dict,  # extract underlying dict for update
-                vol.Optional(
-                    CONF_CHART_COLOR_CHEAP_HOURS,
-                    default=_color_selector_default(
-                        options_data.get(
-                            CONF_CHART_COLOR_CHEAP_HOURS,
-                            current_data.get(
-                                CONF_CHART_COLOR_CHEAP_HOURS,
-                                CHART_COLOR_CHEAP_HOURS_DEFAULT,
-                            ),
-                        ),
-                        CHART_COLOR_CHEAP_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_CHEAP_CURRENT_HOUR,
-                    default=_color_selector_default(
-                        options_data.get(
-                            CONF_CHART_COLOR_CHEAP_CURRENT_HOUR,
-                            current_data.get(
-                                CONF_CHART_COLOR_CHEAP_CURRENT_HOUR,
-                                CHART_COLOR_CHEAP_CURRENT_HOUR_DEFAULT,
-                            ),
-                        ),
-                        CHART_COLOR_CHEAP_CURRENT_HOUR_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-                vol.Optional(
-                    CONF_CHART_COLOR_CHEAP_PAST_HOURS,
-                    default=_color_selector_default(
-                        options_data.get(
-                            CONF_CHART_COLOR_CHEAP_PAST_HOURS,
-                            current_data.get(
-                                CONF_CHART_COLOR_CHEAP_PAST_HOURS,
-                                CHART_COLOR_CHEAP_PAST_HOURS_DEFAULT,
-                            ),
-                        ),
-                        CHART_COLOR_CHEAP_PAST_HOURS_DEFAULT,
-                    ),
-                ): selector.ColorRGBSelector(),
-            }
-            schema_dict = vol.Schema(schema_dict)
+class InputValidationError(HomeAssistantError):
+    """Base error for user input that failed validation."""
 
-        return schema_dict
+    # Translation key shown on the form and the field it is attached to
+    error_key = "invalid_input"
+    field = "base"
 
 
-class CannotConnect(HomeAssistantError):
+class CannotConnect(InputValidationError):
     """Error to indicate we cannot connect."""
 
+    error_key = "cannot_connect"
+
 
-class InvalidCountryCode(HomeAssistantError):
+class InvalidCountryCode(InputValidationError):
     """Error to indicate invalid country code."""
 
+    error_key = "invalid_country_code"
+    field = CONF_COUNTRY_CODE
 
-class InvalidVatRate(HomeAssistantError):
+
+class InvalidVatRate(InputValidationError):
     """Error to indicate invalid VAT rate."""
 
+    error_key = "invalid_vat_rate"
+    field = CONF_VAT
+
 
-class InvalidScanInterval(HomeAssistantError):
+class InvalidScanInterval(InputValidationError):
     """Error to indicate invalid scan interval."""
 
+    error_key = "invalid_scan_interval"
+    field = CONF_SCAN_INTERVAL
+
 
-class InvalidHourRange(HomeAssistantError):
+class InvalidHourRange(InputValidationError):
     """Error to indicate invalid hour range."""
 
+    error_key = "invalid_hour_range"
 
-class InvalidNightHours(HomeAssistantError):
+
+class InvalidNightHours(InputValidationError):
     """Error to indicate invalid night hour configuration."""
 
+    error_key = "invalid_night_hours"
+
 
-class InvalidTimeFormat(HomeAssistantError):
+class InvalidTimeFormat(InputValidationError):
     """Error to indicate invalid time format."""
+
+    error_key = "invalid_time_format"
+
+
+def _set_validation_error(
+    errors: dict[str, str], exc: InputValidationError
+) -> None:
+    """Record a validate_input error under its form field."""
+    errors[exc.field] = exc.error_key
@@ -1,5 +1,6 @@
 """Constants for real_electricity_price."""
 
+from functools import lru_cache
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -166,10 +167,34 @@ def parse_time_string(time_str: str) -> tuple[int, int, int]:
         tuple[int, int, int]: (hour, minute, second)
 
     """
+    # Check the type before the cached call; unhashable input would
+    # otherwise surface as a TypeError from the cache lookup
     if not isinstance(time_str, str):
         msg = "Time string must be a string"
         raise ValueError(msg)
 
+    return _parse_time_string_cached(time_str)
+
+
+@lru_cache(maxsize=64)
+def _parse_time_string_cached(time_str: str) -> tuple[int, int, int]:
+    """Parse a time string; only a handful of distinct values are configured."""
+    # Zero-padded HH:MM and HH:MM:SS, as produced by the TimeSelector, are
+    # sliced out by position; anything else takes the general path below
+    length = len(time_str)
+    if (
+        length in (5, 8)
+        and time_str[2] == ":"
+        and (length == 5 or time_str[5] == ":")
+    ):
+        digits = time_str[0:2] + time_str[3:5] + time_str[6:8]
+        if digits.isascii() and digits.isdigit():
+            hour = int(time_str[0:2])
+            minute = int(time_str[3:5])
+            second = int(time_str[6:8]) if length == 8 else 0
+            if hour <= 23 and minute <= 59 and second <= 59:
+                return hour, minute, second
+
     parts = time_str.split(":")
     if len(parts) == 2:
         # HH:MM format
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import datetime
 import logging
 from typing import TYPE_CHECKING, Any
@@ -14,8 +15,10 @@ from homeassistant.util import dt as dt_util
 
 from .api import RealElectricityPriceApiClientError
 from .const import (
+    CONF_HAS_NIGHT_TARIFF,
     CONF_NIGHT_PRICE_END_TIME,
     CONF_NIGHT_PRICE_START_TIME,
+    HAS_NIGHT_TARIFF_DEFAULT,
     NIGHT_PRICE_END_TIME_DEFAULT,
     NIGHT_PRICE_START_TIME_DEFAULT,
     parse_time_string,
@@ -40,12 +43,20 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
         super().__init__(*args, **kwargs)
         self._last_update_date = None
         self._hourly_update_unsub: Callable[[], None] | None = None
-        self._midnight_update_unsub: Callable[[], None] | None = None
         self._stop_unsub: Callable[[], None] | None = None
         self._cheap_price_coordinator = None  # Will be set after initialization
         self._is_startup = True  # Track if this is initial startup
-
-        # Centralized hourly tick at hh:00 for all sensors (no network call)
+        self._merged_config: dict[str, Any] | None = None
+        self._config_slice: dict[str, int] | None = None
+        self._tariff_window: tuple[int, int] | None = None
+        self._last_validated_dates: tuple[Any, ...] | None = None
+        # Hourly entries sorted by start time, rebuilt when self.data changes
+        self._hourly_index_source: dict[str, Any] | None = None
+        self._hourly_index_starts: list[datetime.datetime] = []
+        self._hourly_index: list[tuple[datetime.datetime, dict[str, Any], str]] = []
+
+        # Centralized hourly tick at hh:00 for all sensors (no network call);
+        # the 00:00 tick also handles the midnight transition
         self._hourly_update_unsub = async_track_time_change(
             self.hass,
             self._handle_hourly_tick,
@@ -53,24 +64,12 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
             second=0,
         )
 
-        # Midnight transition handler for date changes, DST, etc.
-        self._midnight_update_unsub = async_track_time_change(
-            self.hass,
-            self._handle_midnight_transition,
-            hour=0,
-            minute=0,
-            second=0,
-        )
-
-        # Clean up the time trackers on HA stop
+        # Clean up the time tracker on HA stop
         @callback
         def _on_stop(event) -> None:
             if self._hourly_update_unsub:
                 self._hourly_update_unsub()
                 self._hourly_update_unsub = None
-            if self._midnight_update_unsub:
-                self._midnight_update_unsub()
-                self._midnight_update_unsub = None
 
         self._stop_unsub = self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP, _on_stop
@@ -83,6 +82,9 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
         # This does not fetch data; it only tells all entities to update their state
         self.async_update_listeners()
 
+        if now.hour == 0:
+            self._handle_midnight_transition(now)
+
     @callback
     def _handle_midnight_transition(self, now: datetime.datetime) -> None:
         """Handle midnight transition for date changes, DST, etc."""
@@ -96,10 +98,67 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
         # - New year transitions
         self.hass.async_create_task(self.async_request_refresh())
 
+    @property
+    def merged_config(self) -> dict[str, Any]:
+        """Return entry data merged with options (options override data).
+
+        The dict is shared for the coordinator's lifetime; an options change
+        reloads the entry and builds a new coordinator. Treat it as read-only.
+        """
+        if self._merged_config is None:
+            self._merged_config = {
+                **self.config_entry.data,
+                **self.config_entry.options,
+            }
+        return self._merged_config
+
+    def _get_config_slice(self) -> dict[str, int]:
+        """Return the night window hours embedded into each data snapshot."""
+        if self._config_slice is None:
+            config_data = self.merged_config
+
+            # Extract night hours from TimeSelector format
+            start_time = config_data.get(CONF_NIGHT_PRICE_START_TIME)
+            end_time = config_data.get(CONF_NIGHT_PRICE_END_TIME)
+
+            # Extract hours with defaults
+            if isinstance(start_time, dict) and "hour" in start_time:
+                start_hour = int(start_time["hour"])
+            else:
+                start_hour = parse_time_string(NIGHT_PRICE_START_TIME_DEFAULT)[0]
+
+            if isinstance(end_time, dict) and "hour" in end_time:
+                end_hour = int(end_time["hour"])
+            else:
+                end_hour = parse_time_string(NIGHT_PRICE_END_TIME_DEFAULT)[0]
+
+            self._config_slice = {
+                "night_price_start_hour": start_hour,
+                "night_price_end_hour": end_hour,
+            }
+        return self._config_slice
+
+    @property
+    def tariff_window(self) -> tuple[int, int] | None:
+        """Return the (start, end) night tariff hours, or None without a night tariff."""
+        if self._tariff_window is None:
+            if not self.merged_config.get(
+                CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT
+            ):
+                return None
+            config_slice = self._get_config_slice()
+            self._tariff_window = (
+                config_slice["night_price_start_hour"],
+                config_slice["night_price_end_hour"],
+            )
+        return self._tariff_window
+
     async def _async_update_data(self) -> Any:
         """Update data via library."""
+        # Read the clock once per update; the local date and last_sync derive from it
+        now = dt_util.utcnow()
         try:
-            current_date = dt_util.now().date()
+            current_date = dt_util.as_local(now).date()
 
             # Check if we need to force update due to date change
             force_update = self._last_update_date != current_date
@@ -119,7 +178,7 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
                     last_sync = self.data.get("last_sync")
                     if last_sync:
                         # Only preserve data if it's less than 6 hours old
-                        time_since_sync = datetime.datetime.now(datetime.UTC) - last_sync
+                        time_since_sync = now - last_sync
                         if time_since_sync.total_seconds() < 6 * 3600:  # 6 hours
                             _LOGGER.warning(
                                 "API returned no data but preserving recent data from %s to avoid sensor unavailability",
@@ -138,31 +197,11 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
 
             # Add the current timestamp and configuration to the data
             if data is not None:
-                data["last_sync"] = datetime.datetime.now(datetime.UTC)
-
-                # Include relevant configuration for tariff calculation
-                config_data = dict(self.config_entry.data)
-                config_data.update(self.config_entry.options)  # Options override data
-
-                # Extract night hours from TimeSelector format
-                start_time = config_data.get(CONF_NIGHT_PRICE_START_TIME)
-                end_time = config_data.get(CONF_NIGHT_PRICE_END_TIME)
-                
-                # Extract hours with defaults
-                if isinstance(start_time, dict) and "hour" in start_time:
-                    start_hour = int(start_time["hour"])
-                else:
-                    start_hour = parse_time_string(NIGHT_PRICE_START_TIME_DEFAULT)[0]
-                    
-                if isinstance(end_time, dict) and "hour" in end_time:
-                    end_hour = int(end_time["hour"])
-                else:
-                    end_hour = parse_time_string(NIGHT_PRICE_END_TIME_DEFAULT)[0]
+                data["last_sync"] = now
 
-                data["config"] = {
-                    "night_price_start_hour": start_hour,
-                    "night_price_end_hour": end_hour,
-                }
+                # Include relevant configuration for tariff calculation; the
+                # slice is shared between refreshes and must be treated as read-only
+                data["config"] = self._get_config_slice()
 
                 # Validate data dates and log any issues
                 self._validate_data_dates(data, current_date)
@@ -198,7 +237,7 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
             if self.data is not None:
                 last_sync = self.data.get("last_sync")
                 if last_sync:
-                    time_since_sync = datetime.datetime.now(datetime.UTC) - last_sync
+                    time_since_sync = now - last_sync
                     if time_since_sync.total_seconds() < 6 * 3600:  # 6 hours
                         _LOGGER.warning(
                             "API failed but preserving recent data from %s to avoid sensor unavailability",
@@ -212,60 +251,98 @@ class RealElectricityPriceDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _validate_data_dates(self, data: dict, current_date: datetime.date) -> None:
         """Validate that the data contains the expected dates."""
-        yesterday_data = data.get("yesterday")
-        today_data = data.get("today")
-        tomorrow_data = data.get("tomorrow")
+        # Refreshes often return the same days again; skip re-validating them
+        dates = (
+            current_date,
+            *(
+                day_data.get("date") if isinstance(day_data, dict) else None
+                for day_data in (
+                    data.get("yesterday"),
+                    data.get("today"),
+                    data.get("tomorrow"),
+                )
+            ),
+        )
+        if dates == self._last_validated_dates:
+            return
+        self._last_validated_dates = dates
+
+        for label, day_key, expected in (
+            ("Yesterday", "yesterday", current_date - datetime.timedelta(days=1)),
+            ("Today", "today", current_date),
+            ("Tomorrow", "tomorrow", current_date + datetime.timedelta(days=1)),
+        ):
+            day_data = data.get(day_key)
+            if not day_data or "date" not in day_data:
+                continue
 
-        expected_yesterday = current_date - datetime.timedelta(days=1)
-        expected_tomorrow = current_date + datetime.timedelta(days=1)
+            # Dates are ISO strings; a prefix match avoids parsing on the common path
+            date_value = day_data["date"]
+            if isinstance(date_value, str) and date_value[:10] == expected.isoformat():
+                continue
 
-        if yesterday_data and "date" in yesterday_data:
             try:
-                yesterday_date = datetime.datetime.fromisoformat(
-                    yesterday_data["date"]
-                ).date()
-                if yesterday_date != expected_yesterday:
-                    _LOGGER.warning(
-                        "Yesterday data date mismatch: expected %s, got %s",
-                        expected_yesterday,
-                        yesterday_date,
-                    )
+                actual = datetime.datetime.fromisoformat(date_value).date()
             except (ValueError, TypeError):
                 _LOGGER.exception(
-                    "Invalid date format in yesterday data: %s",
-                    yesterday_data.get("date"),
+                    "Invalid date format in %s data: %s", day_key, date_value
                 )
+                continue
 
-        if today_data and "date" in today_data:
-            try:
-                today_date = datetime.datetime.fromisoformat(today_data["date"]).date()
-                if today_date != current_date:
-                    _LOGGER.warning(
-                        "Today data date mismatch: expected %s, got %s",
-                        current_date,
-                        today_date,
-                    )
-            except (ValueError, TypeError):
-                _LOGGER.exception(
-                    "Invalid date format in today data: %s", today_data.get("date")
+            if actual != expected:
+                _LOGGER.warning(
+                    "%s data date mismatch: expected %s, got %s",
+                    label,
+                    expected,
+                    actual,
                 )
 
-        if tomorrow_data and "date" in tomorrow_data:
-            try:
-                tomorrow_date = datetime.datetime.fromisoformat(
-                    tomorrow_data["date"]
-                ).date()
-                if tomorrow_date != expected_tomorrow:
-                    _LOGGER.warning(
-                        "Tomorrow data date mismatch: expected %s, got %s",
-                        expected_tomorrow,
-                        tomorrow_date,
-                    )
-            except (ValueError, TypeError):
-                _LOGGER.exception(
-                    "Invalid date format in tomorrow data: %s",
-                    tomorrow_data.get("date"),
-                )
+    def _ensure_hourly_index(self) -> None:
+        """Parse and sort the hourly entries of the current data snapshot once."""
+        data = self.data
+        if data is self._hourly_index_source:
+            return
+
+        # Search today first; an hour present in several days keeps the first hit
+        by_start: dict[datetime.datetime, tuple[datetime.datetime, dict[str, Any], str]] = {}
+        for data_key in ("today", "tomorrow", "yesterday"):
+            day_data = data.get(data_key) if data else None
+            if not isinstance(day_data, dict):
+                continue
+            for price_entry in day_data.get("hourly_prices", []):
+                try:
+                    start_time = dt_util.parse_datetime(price_entry["start_time"])
+                    end_time = dt_util.parse_datetime(price_entry["end_time"])
+                except (TypeError, ValueError, KeyError):
+                    continue
+                if start_time and end_time:
+                    by_start.setdefault(start_time, (end_time, price_entry, data_key))
+
+        starts = sorted(by_start)
+        self._hourly_index_starts = starts
+        self._hourly_index = [by_start[start] for start in starts]
+        self._hourly_index_source = data
+
+    def current_entry(
+        self, now: datetime.datetime | None = None, day_key: str | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Return the hourly price entry covering ``now`` (default: current time).
+
+        With ``day_key`` only an entry from that day ("today", "tomorrow" or
+        "yesterday") is returned.
+        """
+        self._ensure_hourly_index()
+        if now is None:
+            now = dt_util.now()
+
+        position = bisect.bisect_right(self._hourly_index_starts, now) - 1
+        if position < 0:
+            return None
+        end_time, price_entry, data_key = self._hourly_index[position]
+        if now >= end_time or (day_key is not None and data_key != day_key):
+            return None
+        return price_entry
 
     def set_cheap_price_coordinator(self, coordinator) -> None:
         """Set the cheap price coordinator for automatic updates."""
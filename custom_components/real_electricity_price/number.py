@@ -20,7 +20,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up number entities (acceptable price)."""
-    cfg = {**entry.data, **entry.options}
+    cfg = entry.runtime_data.coordinator.merged_config
     if not cfg.get(CONF_CALCULATE_CHEAP_HOURS, True):
         return
     entities = [
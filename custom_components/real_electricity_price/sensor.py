@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from .const import CONF_CALCULATE_CHEAP_HOURS
@@ -43,7 +44,7 @@ SENSOR_TYPE_NEXT_CHEAP_HOURS_END = "next_cheap_hours_end"
 SENSOR_TYPE_CHART_DATA = "chart_data"
 
 # Sensor registry mapping sensor keys to their types and classes
-SENSOR_REGISTRY = {
+SENSOR_REGISTRY = MappingProxyType({
     "real_electricity_price_current_price": (
         SENSOR_TYPE_CURRENT_PRICE,
         CurrentPriceSensor,
@@ -88,7 +89,21 @@ SENSOR_REGISTRY = {
         SENSOR_TYPE_CHART_DATA,
         ChartDataSensor,
     ),
-}
+})
+
+# Sensors driven by the cheap hours coordinator, in the order they are added
+_CHEAP_HOURS_SENSOR_KEYS = (
+    "real_electricity_price_cheap_hours",
+    "real_electricity_price_next_cheap_hours_start",
+    "real_electricity_price_next_cheap_hours_end",
+    "real_electricity_price_last_cheap_calculation",
+)
+_CHEAP_HOURS_SENSOR_KEY_SET = frozenset(_CHEAP_HOURS_SENSOR_KEYS)
+
+# Entity descriptions indexed by key
+_DESCRIPTIONS_BY_KEY = MappingProxyType(
+    {description.key: description for description in SENSOR_DESCRIPTIONS}
+)
 
 
 async def async_setup_entry(
@@ -102,17 +117,10 @@ async def async_setup_entry(
     entities = []
 
     # Add main coordinator sensors (excluding cheap hours sensors)
-    cheap_hours_keys = {
-        "real_electricity_price_cheap_hours",
-        "real_electricity_price_next_cheap_hours_start",
-        "real_electricity_price_next_cheap_hours_end",
-        "real_electricity_price_last_cheap_calculation",
-    }
-
     for description in SENSOR_DESCRIPTIONS:
         key = description.key
         # Skip cheap hours sensors - they'll be added separately with the cheap hours coordinator
-        if key in cheap_hours_keys:
+        if key in _CHEAP_HOURS_SENSOR_KEY_SET:
             continue
 
         if key in SENSOR_REGISTRY:
@@ -129,23 +137,10 @@ async def async_setup_entry(
             _LOGGER.warning("Unknown sensor key: %s", key)
 
     # Add cheap hours coordinator sensors only if enabled
-    cfg = {**entry.data, **entry.options}
+    cfg = entry.runtime_data.coordinator.merged_config
     if cfg.get(CONF_CALCULATE_CHEAP_HOURS, True):
-        cheap_hours_sensors = [
-            "real_electricity_price_cheap_hours",
-            "real_electricity_price_next_cheap_hours_start",
-            "real_electricity_price_next_cheap_hours_end",
-            "real_electricity_price_last_cheap_calculation",
-        ]
-
-        for key in cheap_hours_sensors:
-            # Find the description with matching key
-            description = None
-            for desc in SENSOR_DESCRIPTIONS:
-                if desc.key == key:
-                    description = desc
-                    break
-
+        for key in _CHEAP_HOURS_SENSOR_KEYS:
+            description = _DESCRIPTIONS_BY_KEY.get(key)
             if description and key in SENSOR_REGISTRY:
                 sensor_type, sensor_class = SENSOR_REGISTRY[key]
                 _LOGGER.debug(
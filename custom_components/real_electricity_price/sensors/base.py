@@ -76,6 +76,8 @@ class RealElectricityPriceBaseSensor(RealElectricityPriceEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+        # Structured config, built on first use
+        self._config_cache: IntegrationConfig | None = None
 
     @abstractmethod
     def native_value(self) -> Any:
@@ -83,11 +85,15 @@ class RealElectricityPriceBaseSensor(RealElectricityPriceEntity, SensorEntity):
 
     def get_config(self) -> IntegrationConfig:
         """Get configuration as a structured object."""
-        config_data = {
-            **self.coordinator.config_entry.data,
-            **self.coordinator.config_entry.options,
-        }
+        # Options changes reload the entry with new sensors, so the cache
+        # lives as long as the entry
+        if self._config_cache is None:
+            self._config_cache = self._build_config(self.coordinator.merged_config)
+        return self._config_cache
 
+    @staticmethod
+    def _build_config(config_data: dict[str, Any]) -> IntegrationConfig:
+        """Build the structured config from merged entry data and options."""
         return IntegrationConfig(
             grid=config_data.get(CONF_GRID, GRID_DEFAULT),
             supplier=config_data.get(CONF_SUPPLIER, SUPPLIER_DEFAULT),
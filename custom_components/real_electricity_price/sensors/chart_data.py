@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -82,13 +84,16 @@ class ChartDataSensor(RealElectricityPriceBaseSensor):
         # Get cheap hours data
         cheap_ranges = self._get_cheap_hour_ranges()
 
-        # Gather configuration (colors, acceptable price, etc.) once
-        config_data: dict[str, Any] = {}
-        if hasattr(self.coordinator, "config_entry") and self.coordinator.config_entry:
-            config_data.update(self.coordinator.config_entry.data or {})
-            config_data.update(self.coordinator.config_entry.options or {})
-        config_data[CONF_ACCEPTABLE_PRICE] = self._get_effective_acceptable_price(
-            config_data
+        # Gather configuration (colors, acceptable price, etc.) once; the
+        # coordinator's merged config is shared, so layer the override on top
+        merged_config = self.coordinator.merged_config
+        config_data = ChainMap(
+            {
+                CONF_ACCEPTABLE_PRICE: self._get_effective_acceptable_price(
+                    merged_config
+                )
+            },
+            merged_config,
         )
 
         # Collect hourly price data for 48 hours: today + tomorrow only
@@ -146,10 +151,7 @@ class ChartDataSensor(RealElectricityPriceBaseSensor):
         """Get cheap hour ranges from the cheap hours sensor."""
         try:
             # Respect configuration: if cheap hours are disabled, don't compute ranges
-            cfg = {}
-            if hasattr(self.coordinator, 'config_entry') and self.coordinator.config_entry:
-                cfg.update(self.coordinator.config_entry.data or {})
-                cfg.update(self.coordinator.config_entry.options or {})
+            cfg = self.coordinator.merged_config
             if not cfg.get(CONF_CALCULATE_CHEAP_HOURS, True):
                 return []
 
@@ -182,7 +184,7 @@ class ChartDataSensor(RealElectricityPriceBaseSensor):
         return None
 
     def _get_effective_acceptable_price(
-        self, config_data: dict[str, Any] | None = None
+        self, config_data: Mapping[str, Any] | None = None
     ) -> float:
         """Read acceptable price, preferring runtime override from cheap coordinator."""
         cheap_coord = self._get_linked_cheap_coordinator()
@@ -195,10 +197,7 @@ class ChartDataSensor(RealElectricityPriceBaseSensor):
                     pass
 
         if config_data is None:
-            config_data = {}
-            if hasattr(self.coordinator, "config_entry") and self.coordinator.config_entry:
-                config_data.update(self.coordinator.config_entry.data or {})
-                config_data.update(self.coordinator.config_entry.options or {})
+            config_data = self.coordinator.merged_config
 
         acceptable_price_raw = config_data.get(
             CONF_ACCEPTABLE_PRICE, ACCEPTABLE_PRICE_DEFAULT
@@ -219,7 +218,7 @@ class ChartDataSensor(RealElectricityPriceBaseSensor):
         next_hour_ts: int,
         cheap_ranges: list,
         price: float,
-        config_data: dict,
+        config_data: Mapping[str, Any],
     ) -> str:
         """Determine the color for a bar based on time and cheap hour status."""
         try:
@@ -81,8 +81,10 @@ def _get_price_analysis_info_for_entity(
             min_start_time=current_hour_start,
         )
 
+        # Day keys in their fixed chronological order; other keys hold metadata
         future_data_sources: list[dict[str, Any]] = []
-        for data_key, day_data in entity.coordinator.data.items():
+        for data_key in ("yesterday", "today", "tomorrow"):
+            day_data = entity.coordinator.data.get(data_key)
             if not isinstance(day_data, dict) or not day_data.get(
                 "data_available", False
             ):
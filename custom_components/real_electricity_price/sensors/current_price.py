@@ -3,93 +3,54 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.util import dt as dt_util
 
 from ..const import (
-    CONF_HAS_NIGHT_TARIFF,
-    CONF_NIGHT_PRICE_END_TIME,
-    CONF_NIGHT_PRICE_START_TIME,
-    HAS_NIGHT_TARIFF_DEFAULT,
-    NIGHT_PRICE_END_TIME_DEFAULT,
-    NIGHT_PRICE_START_TIME_DEFAULT,
     TARIFF_FIXED,
     TARIFF_OFF_PEAK,
     TARIFF_PEAK,
-    parse_time_string,
 )
 
 from .base import RealElectricityPriceBaseSensor
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from ..models import IntegrationConfig
 
 _LOGGER = logging.getLogger(__name__)
 
-# Parse default time strings once at module level
-try:
-    _DEFAULT_NIGHT_START_HOUR, _, _ = parse_time_string(NIGHT_PRICE_START_TIME_DEFAULT)
-    _DEFAULT_NIGHT_END_HOUR, _, _ = parse_time_string(NIGHT_PRICE_END_TIME_DEFAULT)
-except Exception:
-    # Should never happen with hardcoded values, but just in case
-    _DEFAULT_NIGHT_START_HOUR = 22
-    _DEFAULT_NIGHT_END_HOUR = 7
+
+@lru_cache(maxsize=8)
+def _night_hours(night_start: int, night_end: int) -> frozenset[int]:
+    """Return the local hours covered by a night window, wrapping past midnight."""
+    if night_start > night_end:
+        return frozenset(range(night_start, 24)) | frozenset(range(night_end))
+    return frozenset(range(night_start, night_end))
 
 
 def _read_current_hour_tariff(coordinator) -> str | None:
     """Read tariff from current hour's pre-computed data."""
     if not coordinator.data:
         return None
-    now = dt_util.now().replace(minute=0, second=0, microsecond=0)
-    for data_key in ["today", "yesterday", "tomorrow"]:
-        day_data = coordinator.data.get(data_key)
-        if not isinstance(day_data, dict):
-            continue
-        for price_entry in day_data.get("hourly_prices", []):
-            try:
-                start_time = dt_util.parse_datetime(price_entry["start_time"])
-                end_time = dt_util.parse_datetime(price_entry["end_time"])
-                if start_time and end_time and start_time <= now < end_time:
-                    tariff = price_entry.get("tariff")
-                    if tariff:
-                        return tariff
-            except (ValueError, KeyError):
-                continue
-    return None
+    price_entry = coordinator.current_entry()
+    if price_entry is None:
+        return None
+    return price_entry.get("tariff") or None
 
 
 def _determine_tariff_from_config(coordinator) -> str:
     """Determine current tariff from config without holiday lookup (fallback)."""
-    config_data = {
-        **coordinator.config_entry.data,
-        **coordinator.config_entry.options,
-    }
-    has_night_tariff = config_data.get(CONF_HAS_NIGHT_TARIFF, HAS_NIGHT_TARIFF_DEFAULT)
-    if not has_night_tariff:
+    # The coordinator resolves the night window once per config change
+    tariff_window = coordinator.tariff_window
+    if tariff_window is None:
         return TARIFF_FIXED
 
-    start_val = config_data.get(
-        CONF_NIGHT_PRICE_START_TIME, NIGHT_PRICE_START_TIME_DEFAULT
-    )
-    end_val = config_data.get(
-        CONF_NIGHT_PRICE_END_TIME, NIGHT_PRICE_END_TIME_DEFAULT
-    )
-    night_start = (
-        int(start_val["hour"])
-        if isinstance(start_val, dict) and "hour" in start_val
-        else _DEFAULT_NIGHT_START_HOUR
-    )
-    night_end = (
-        int(end_val["hour"])
-        if isinstance(end_val, dict) and "hour" in end_val
-        else _DEFAULT_NIGHT_END_HOUR
-    )
-    local_hour = dt_util.now().hour
-    if night_start > night_end:
-        is_night_time = local_hour >= night_start or local_hour < night_end
-    else:
-        is_night_time = night_start <= local_hour < night_end
+    is_night_time = dt_util.now().hour in _night_hours(*tariff_window)
     return TARIFF_OFF_PEAK if is_night_time else TARIFF_PEAK
 
 
@@ -104,6 +65,18 @@ def _get_current_tariff(coordinator) -> str:
 class CurrentPriceSensor(RealElectricityPriceBaseSensor):
     """Sensor for current electricity price."""
 
+    def __init__(self, coordinator, description) -> None:
+        """Initialize the current price sensor."""
+        super().__init__(coordinator, description)
+        # Attributes and the (hour entry, config, tariff) they were built from
+        self._attributes_key: tuple[Any, IntegrationConfig, str] | None = None
+        self._attributes_cache: Mapping[str, Any] = MappingProxyType({})
+
+    def _handle_coordinator_update(self) -> None:  # type: ignore[override]
+        """Drop the cached attributes before writing the new state."""
+        self._attributes_key = None
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> float | None:
         """Return the current electricity price."""
@@ -113,13 +86,30 @@ class CurrentPriceSensor(RealElectricityPriceBaseSensor):
         return self._get_current_price_value()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional state attributes."""
         if not self.coordinator.data:
             return {}
 
+        # Attributes only change with the current hour entry, config or tariff
         config = self.get_config()
-
+        price_entry = self.coordinator.current_entry()
+        current_tariff = _get_current_tariff(self.coordinator)
+        key = self._attributes_key
+        if (
+            key is not None
+            and key[0] is price_entry
+            and key[1] is config
+            and key[2] == current_tariff
+        ):
+            return self._attributes_cache
+
+        self._attributes_cache = MappingProxyType(self._build_attributes(config))
+        self._attributes_key = (price_entry, config, current_tariff)
+        return self._attributes_cache
+
+    def _build_attributes(self, config: IntegrationConfig) -> dict[str, Any]:
+        """Build the price components and calculation details attributes."""
         # Get current price components and VAT-applied values
         base_components = self._get_price_components(config)
         calc = self._get_calculation_details(config)
@@ -333,77 +323,31 @@ class CurrentPriceSensor(RealElectricityPriceBaseSensor):
         if not self.coordinator.data:
             return None
 
-        # Use Home Assistant's datetime utility for consistent timezone handling
-        now = dt_util.now().replace(minute=0, second=0, microsecond=0)
-
-        for data_key in ["yesterday", "today", "tomorrow"]:
-            day_data = self.coordinator.data.get(data_key)
-            if not isinstance(day_data, dict):
-                continue
-
-            hourly_prices = day_data.get("hourly_prices", [])
-            for price_entry in hourly_prices:
-                try:
-                    # Native datetime objects from attributes (no string parsing needed)
-                    start_time_str = price_entry["start_time"]
-                    end_time_str = price_entry["end_time"]
-
-                    # Parse ISO format datetime strings consistently
-                    start_time = dt_util.parse_datetime(start_time_str)
-                    end_time = dt_util.parse_datetime(end_time_str)
-
-                    if start_time and end_time and start_time <= now < end_time:
-                        return price_entry.get("nord_pool_price")
-                except (ValueError, KeyError):
-                    continue
-
-        return None
+        price_entry = self.coordinator.current_entry()
+        if price_entry is None:
+            return None
+        return price_entry.get("nord_pool_price")
 
     def _get_current_price_value(self) -> float | None:
         """Get current price from all available hourly prices data."""
         if not self.coordinator.data:
             return None
 
-        # Use Home Assistant's datetime utility for consistent timezone handling
-        now = dt_util.now().replace(minute=0, second=0, microsecond=0)
-
-        for data_key in ["yesterday", "today", "tomorrow"]:
-            day_data = self.coordinator.data.get(data_key)
-            if not isinstance(day_data, dict):
-                continue
-
-            hourly_prices = day_data.get("hourly_prices", [])
-            for price_entry in hourly_prices:
-                try:
-                    # Parse ISO format datetime strings consistently
-                    start_time_str = price_entry["start_time"]
-                    end_time_str = price_entry["end_time"]
-
-                    start_time = dt_util.parse_datetime(start_time_str)
-                    end_time = dt_util.parse_datetime(end_time_str)
-
-                    if start_time and end_time and start_time <= now < end_time:
-                        price_value = price_entry["actual_price"]
-                        if price_value is None:
-                            _LOGGER.debug(
-                                "Skipping unavailable price entry for time %s in %s data",
-                                now,
-                                data_key,
-                            )
-                            continue
-                        _LOGGER.debug(
-                            "Found current price: %s for time %s in %s data",
-                            price_value,
-                            now,
-                            data_key,
-                        )
-                        return self._round_price(price_value)
-                except (ValueError, KeyError) as e:
-                    _LOGGER.warning("Invalid price entry in %s: %s", data_key, e)
-                    continue
-
-        _LOGGER.debug("No current price found for time %s in any available data", now)
-        return None
+        # The coordinator keeps the hourly entries parsed and sorted per snapshot
+        now = dt_util.now()
+        price_entry = self.coordinator.current_entry(now)
+        if price_entry is None:
+            _LOGGER.debug(
+                "No current price found for time %s in any available data", now
+            )
+            return None
+
+        price_value = price_entry.get("actual_price")
+        if price_value is None:
+            _LOGGER.debug("Skipping unavailable price entry for time %s", now)
+            return None
+        _LOGGER.debug("Found current price: %s for time %s", price_value, now)
+        return self._round_price(price_value)
 
 
 class CurrentTariffSensor(RealElectricityPriceBaseSensor):
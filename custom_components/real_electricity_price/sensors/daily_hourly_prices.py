@@ -5,8 +5,6 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.util import dt as dt_util
-
 from .base import RealElectricityPriceBaseSensor
 
 if TYPE_CHECKING:
@@ -22,6 +20,9 @@ class DailyHourlyPricesSensor(RealElectricityPriceBaseSensor):
         """Initialize the daily hourly prices sensor."""
         super().__init__(coordinator, description)
         self._day_key = day_key
+        # Attribute payload for the day snapshot it was built from
+        self._attributes_source: dict[str, Any] | None = None
+        self._attributes_cache: dict[str, Any] = {}
         _LOGGER.debug(
             "DAILY SENSOR CREATED: %s with day_key: %s", description.key, day_key
         )
@@ -44,33 +45,13 @@ class DailyHourlyPricesSensor(RealElectricityPriceBaseSensor):
         if not hourly_prices:
             return None
 
-        # For "today", try to get current hour price
+        # For "today", try to get current hour price from the coordinator's index
         if self._day_key == "today":
-            # Use Home Assistant's datetime utility for consistent timezone handling
-            current_time = dt_util.now()
-            for price_entry in hourly_prices:
-                start_time_str = price_entry.get("start_time")
-                end_time_str = price_entry.get("end_time")
-
-                if start_time_str and end_time_str:
-                    try:
-                        # Parse timezone-aware datetime strings using HA utilities
-                        start_time = dt_util.parse_datetime(start_time_str)
-                        end_time = dt_util.parse_datetime(end_time_str)
-
-                        if (
-                            start_time
-                            and end_time
-                            and start_time <= current_time < end_time
-                        ):
-                            price = price_entry.get("actual_price")
-                            if price is not None:
-                                return self._round_price(price)
-                    except (ValueError, TypeError) as e:
-                        _LOGGER.debug(
-                            "Failed to parse time for current hour lookup: %s", e
-                        )
-                        continue
+            price_entry = self.coordinator.current_entry(day_key="today")
+            if price_entry is not None:
+                price = price_entry.get("actual_price")
+                if price is not None:
+                    return self._round_price(price)
 
         # For yesterday/tomorrow, or if current hour not found for today, return average price
         valid_prices = [
@@ -95,6 +76,26 @@ class DailyHourlyPricesSensor(RealElectricityPriceBaseSensor):
         if not isinstance(day_data, dict):
             return {}
 
+        # The hourly payload only changes with a new data snapshot
+        if day_data is not self._attributes_source:
+            self._attributes_cache = self._build_day_attributes(day_data)
+            self._attributes_source = day_data
+
+        # State type description based on day key and current value
+        state_description = "No data"
+        if self.native_value is not None:
+            if self._day_key == "today":
+                state_description = "Current hour price"
+            else:
+                state_description = "Average day price"
+
+        return {
+            **self._attributes_cache,
+            "state_description": state_description,
+        }
+
+    def _build_day_attributes(self, day_data: dict[str, Any]) -> dict[str, Any]:
+        """Build the hourly prices and statistics attributes for a day."""
         date = day_data.get("date", "unknown")
         data_available = day_data.get("data_available", False)
         is_holiday = day_data.get("is_holiday", False)
@@ -140,14 +141,6 @@ class DailyHourlyPricesSensor(RealElectricityPriceBaseSensor):
                 "valid_hours_count": len(valid_prices),
             }
 
-        # State type description based on day key and current value
-        state_description = "No data"
-        if self.native_value is not None:
-            if self._day_key == "today":
-                state_description = "Current hour price"
-            else:
-                state_description = "Average day price"
-
         return {
             "hourly_prices": processed_prices,
             "statistics": statistics,
@@ -155,7 +148,6 @@ class DailyHourlyPricesSensor(RealElectricityPriceBaseSensor):
             "data_available": data_available,
             "is_holiday": is_holiday,
             "is_weekend": is_weekend,
-            "state_description": state_description,
         }
 
 
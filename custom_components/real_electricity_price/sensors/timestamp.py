@@ -17,6 +17,13 @@ _LOGGER = logging.getLogger(__name__)
 class LastSyncSensor(RealElectricityPriceBaseSensor):
     """Sensor for last sync timestamp."""
 
+    def __init__(self, coordinator, description: SensorEntityDescription) -> None:
+        """Initialize the last sync sensor."""
+        super().__init__(coordinator, description)
+        # Data sources summary for the data snapshot it was built from
+        self._data_sources_source: dict[str, Any] | None = None
+        self._data_sources_info: dict[str, Any] = {}
+
     @property
     def native_value(self) -> datetime | None:
         """Return the last sync timestamp."""
@@ -40,10 +47,23 @@ class LastSyncSensor(RealElectricityPriceBaseSensor):
         if not self.coordinator.data:
             return {}
 
-        # Get data sources info
+        # Data sources only change with a new data snapshot
+        data = self.coordinator.data
+        if data is not self._data_sources_source:
+            self._data_sources_info = self._build_data_sources_info(data)
+            self._data_sources_source = data
+
+        return {
+            "data_sources": self._data_sources_info,
+            "coordinator_type": type(self.coordinator).__name__,
+        }
+
+    @staticmethod
+    def _build_data_sources_info(data: dict[str, Any]) -> dict[str, Any]:
+        """Summarize the date and hour count of each fetched day."""
         data_sources_info = {}
-        for data_key in ["yesterday", "today", "tomorrow"]:
-            day_data = self.coordinator.data.get(data_key)
+        for data_key in ("yesterday", "today", "tomorrow"):
+            day_data = data.get(data_key)
             if isinstance(day_data, dict):
                 date = day_data.get("date", "unknown")
                 data_available = day_data.get("data_available", False)
@@ -54,11 +74,7 @@ class LastSyncSensor(RealElectricityPriceBaseSensor):
                     "data_available": data_available,
                     "hours_count": len(hourly_prices),
                 }
-
-        return {
-            "data_sources": data_sources_info,
-            "coordinator_type": type(self.coordinator).__name__,
-        }
+        return data_sources_info
 
 
 class LastCheapCalculationSensor(RealElectricityPriceBaseSensor):
@@ -29,7 +29,15 @@ import json
 import os
 import sqlite3
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser is used when it is missing
+    orjson = None
+
+# Both accept str or bytes; orjson is several times faster on attribute payloads
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -46,16 +54,16 @@ def load_json(path: str) -> Any:
         return json.load(f)
 
 
-def get_integration_entry_ids(domain: str) -> List[str]:
+def get_integration_entry_ids(domain: str) -> Set[str]:
     data = load_json(CONFIG_ENTRIES_PATH)
-    entry_ids: List[str] = []
+    entry_ids: Set[str] = set()
     # core.config_entries schema: { "data": { "entries": [ {"domain": str, "entry_id": str, ...}, ...]}}
     entries = data.get("data", {}).get("entries", [])
     for entry in entries:
         if entry.get("domain") == domain:
             eid = entry.get("entry_id")
             if isinstance(eid, str):
-                entry_ids.append(eid)
+                entry_ids.add(eid)
     return entry_ids
 
 
@@ -69,7 +77,7 @@ class EntityInfo:
     original_name: Optional[str]
 
 
-def get_integration_entities(entry_ids: List[str], domain: str) -> List[EntityInfo]:
+def get_integration_entities(entry_ids: Set[str], domain: str) -> List[EntityInfo]:
     reg = load_json(ENTITY_REG_PATH)
     out: List[EntityInfo] = []
     entities = reg.get("data", {}).get("entities", [])
@@ -79,7 +87,11 @@ def get_integration_entities(entry_ids: List[str], domain: str) -> List[EntityIn
             continue
         # Match by config_entry_id OR by registry platform == domain (fallback)
         if ent.get("config_entry_id") in entry_ids or ent.get("platform") == domain:
-            ent_dom = ent_id.split(".")[0] if isinstance(ent_id, str) and "." in ent_id else None
+            ent_dom = None
+            if isinstance(ent_id, str):
+                ent_dom, sep, _ = ent_id.partition(".")
+                if not sep:
+                    ent_dom = None
             out.append(
                 EntityInfo(
                     entity_id=ent_id,
@@ -98,10 +110,31 @@ def has_column(conn: sqlite3.Connection, table: str, column: str) -> bool:
     return any(row[1] == column for row in cur.fetchall())
 
 
-def get_latest_state(conn: sqlite3.Connection, entity_id: str) -> Tuple[Optional[str], Optional[float], Optional[float], Dict[str, Any]]:
-    """Return latest (state, last_changed_ts, last_updated_ts, attributes_dict) for entity_id.
+# Entity ids per batched recorder query, well below SQLite's host parameter limit
+STATE_QUERY_BATCH_SIZE = 500
+# Prepared statements kept by each sqlite3 connection
+SQLITE_CACHED_STATEMENTS = 256
+
+
+# Latest state per requested entity; the schema-dependent parts are filled in
+# by _build_state_query and the IN list by _expand_placeholders
+_STATE_QUERY_TEMPLATE = (
+    "SELECT sm.entity_id, s.state, {time_cols}, {attrs_expr} as attrs "
+    "FROM states s "
+    "JOIN states_meta sm ON s.metadata_id = sm.metadata_id "
+    "{attrs_join}"
+    "WHERE s.state_id IN ("
+    "SELECT (SELECT s2.state_id FROM states s2 WHERE s2.metadata_id = sm2.metadata_id "
+    "ORDER BY s2.{order_col} DESC LIMIT 1) "
+    "FROM states_meta sm2 WHERE sm2.entity_id IN ({{placeholders}}))"
+)
+
+
+def _build_state_query(conn: sqlite3.Connection) -> str:
+    """Probe the recorder schema once and return the latest-states SQL.
 
-    Uses the recorder schema states + states_meta.
+    The SQL contains a ``{placeholders}`` slot for the entity_id IN list and
+    returns (entity_id, state, last_changed, last_updated, attrs) rows.
     """
     # Determine time columns available
     use_ts = has_column(conn, "states", "last_updated_ts")
@@ -109,41 +142,90 @@ def get_latest_state(conn: sqlite3.Connection, entity_id: str) -> Tuple[Optional
 
     # Prefer joined attributes from state_attributes.shared_attrs when available
     has_attr_id = has_column(conn, "states", "attributes_id")
-    has_state_attr = bool(
-        [t for t in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall() if t[0] == "state_attributes"]
+    has_state_attr = (
+        conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='state_attributes'"
+        ).fetchone()
+        is not None
     )
     shared_col = None
     if has_state_attr and has_attr_id and has_column(conn, "state_attributes", "shared_attrs"):
         shared_col = "sa.shared_attrs"
 
-    attrs_expr = f"COALESCE({shared_col}, s.attributes)" if shared_col else "s.attributes"
-    order_col = "s.last_updated_ts" if use_ts else "s.last_updated"
-
-    sql = (
-        f"SELECT s.state, {time_cols}, {attrs_expr} as attrs "
-        "FROM states s "
-        "JOIN states_meta sm ON s.metadata_id = sm.metadata_id "
-        + ("LEFT JOIN state_attributes sa ON sa.attributes_id = s.attributes_id " if shared_col else "")
-        + "WHERE sm.entity_id = ? "
-        f"ORDER BY {order_col} DESC LIMIT 1"
+    # One row per entity: the newest state of each requested metadata_id
+    return _STATE_QUERY_TEMPLATE.format(
+        time_cols=time_cols,
+        attrs_expr=f"COALESCE({shared_col}, s.attributes)" if shared_col else "s.attributes",
+        attrs_join=(
+            "LEFT JOIN state_attributes sa ON sa.attributes_id = s.attributes_id "
+            if shared_col
+            else ""
+        ),
+        order_col="last_updated_ts" if use_ts else "last_updated",
     )
-    cur = conn.execute(sql, (entity_id,))
-    row = cur.fetchone()
-    if not row:
-        return None, None, None, {}
-
-    state = row[0]
-    last_changed = row[1]
-    last_updated = row[2]
-    attrs_raw = row[3]
-    attrs: Dict[str, Any]
+
+
+def _expand_placeholders(sql: str, count: int) -> str:
+    """Fill the ``{placeholders}`` slot of ``sql`` with ``count`` parameter markers."""
+    # Only "?" markers are interpolated; the entity ids are bound by sqlite3
+    return sql.format(placeholders=",".join("?" * count))
+
+
+def _parse_attributes(attrs_raw: Any) -> Dict[str, Any]:
+    """Decode a recorder attributes column into a dict."""
+    if not attrs_raw or not isinstance(attrs_raw, (str, bytes, bytearray)):
+        return {}
     try:
-        if isinstance(attrs_raw, (bytes, bytearray)):
-            attrs_raw = attrs_raw.decode("utf-8", "ignore")
-        attrs = json.loads(attrs_raw) if isinstance(attrs_raw, str) else {}
-    except Exception:
-        attrs = {"_error": "failed_to_parse_attributes"}
-    return state, last_changed, last_updated, attrs
+        # Parse bytes directly instead of decoding them to str first
+        return _json_loads(attrs_raw)
+    except ValueError:  # JSON and UTF-8 decode errors of both parsers
+        return {"_error": "failed_to_parse_attributes"}
+
+
+# Placeholder row for entities without a recorded state
+_MISSING_STATE: Tuple[None, None, None, None] = (None, None, None, None)
+
+
+def get_latest_states(
+    conn: sqlite3.Connection, sql: str, entity_ids: List[str]
+) -> Dict[str, Tuple[Optional[str], Optional[float], Optional[float], Any]]:
+    """Return {entity_id: (state, last_changed_ts, last_updated_ts, raw_attributes)}.
+
+    Uses the recorder schema states + states_meta; ``sql`` comes from _build_state_query.
+    Attributes are left undecoded (see _parse_attributes) so they are only
+    parsed while being written. Entities without a recorded state are missing
+    from the result.
+    """
+    latest: Dict[str, Tuple[Optional[str], Optional[float], Optional[float], Any]] = {}
+    # Expand the IN list once per batch size so full batches reuse one prepared statement
+    statements: Dict[int, str] = {}
+    for start in range(0, len(entity_ids), STATE_QUERY_BATCH_SIZE):
+        batch = entity_ids[start : start + STATE_QUERY_BATCH_SIZE]
+        batch_sql = statements.get(len(batch))
+        if batch_sql is None:
+            batch_sql = statements[len(batch)] = _expand_placeholders(sql, len(batch))
+        for entity_id, state, last_changed, last_updated, attrs_raw in conn.execute(batch_sql, batch):
+            latest[entity_id] = (state, last_changed, last_updated, attrs_raw)
+    return latest
+
+
+def write_export(out_path: str, integration: str, records: Iterable[Dict[str, Any]]) -> int:
+    """Stream records into the export JSON file one at a time; return the count.
+
+    The layout matches json.dump(..., indent=2) of {"integration", "entities"}.
+    """
+    count = 0
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(f'  "integration": {json.dumps(integration, ensure_ascii=False)},\n')
+        f.write('  "entities": [')
+        for record in records:
+            body = json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+            f.write(",\n    " if count else "\n    ")
+            f.write(body)
+            count += 1
+        f.write("\n  ]\n}" if count else "]\n}")
+    return count
 
 
 def _auto_detect_domain(default: Optional[str] = None) -> str:
@@ -201,46 +283,38 @@ def main() -> None:
 
     entities = get_integration_entities(entry_ids, domain)
 
-    results: List[Dict[str, Any]] = []
+    latest: Dict[str, Tuple[Optional[str], Optional[float], Optional[float], Any]] = {}
     if os.path.exists(DB_PATH):
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, cached_statements=SQLITE_CACHED_STATEMENTS)
         try:
-            for info in entities:
-                state, last_changed, last_updated, attrs = get_latest_state(conn, info.entity_id)
-                results.append(
-                    {
-                        "entity_id": info.entity_id,
-                        "name": info.name or info.original_name,
-                        "platform": info.platform,
-                        "unique_id": info.unique_id,
-                        "state": state,
-                        "last_changed": last_changed,
-                        "last_updated": last_updated,
-                        "attributes": attrs,
-                    }
-                )
+            # Read-only session; a larger page cache helps the batched lookup
+            conn.execute("PRAGMA cache_size=-16000")
+            # The schema is the same for every entity; probe it once
+            state_sql = _build_state_query(conn)
+            latest = get_latest_states(conn, state_sql, [info.entity_id for info in entities])
         finally:
             conn.close()
-    else:
-        # DB not present; export registry info only
+    # Without a DB only the registry info is exported
+
+    def records() -> Iterator[Dict[str, Any]]:
         for info in entities:
-            results.append(
-                {
-                    "entity_id": info.entity_id,
-                    "name": info.name or info.original_name,
-                    "platform": info.platform,
-                    "unique_id": info.unique_id,
-                    "state": None,
-                    "last_changed": None,
-                    "last_updated": None,
-                    "attributes": {},
-                }
+            state, last_changed, last_updated, attrs_raw = latest.pop(
+                info.entity_id, _MISSING_STATE
             )
+            yield {
+                "entity_id": info.entity_id,
+                "name": info.name or info.original_name,
+                "platform": info.platform,
+                "unique_id": info.unique_id,
+                "state": state,
+                "last_changed": last_changed,
+                "last_updated": last_updated,
+                "attributes": _parse_attributes(attrs_raw),
+            }
 
     # Write output
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump({"integration": "real_electricity_price", "entities": results}, f, ensure_ascii=False, indent=2)
-    print(f"Wrote {len(results)} entities to {out_path}")
+    count = write_export(out_path, "real_electricity_price", records())
+    print(f"Wrote {count} entities to {out_path}")
 
 
 if __name__ == "__main__":
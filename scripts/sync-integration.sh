@@ -1,6 +1,9 @@
 #!/usr/bin/env bash
 #
-# Sync Integration files to Podman container
+# Reload Integration files in the Podman container
+#
+# docker-compose.yml bind-mounts custom_components/real_electricity_price into
+# the container, so there is a single copy of the sources and nothing to copy.
 #
 
 set -e
@@ -25,20 +28,9 @@ print_success() {
 # Sync integration files
 sync_files() {
     SOURCE_DIR="$PROJECT_ROOT/custom_components/real_electricity_price"
-    TARGET_DIR="$PROJECT_ROOT/container/config/custom_components/real_electricity_price"
-    
-    print_status "Syncing integration files..."
-    print_status "From: $SOURCE_DIR"
-    print_status "To: $TARGET_DIR"
-    
-    # Create target directory if it doesn't exist
-    mkdir -p "$TARGET_DIR"
-    
-    # Copy all files
-    cp -r "$SOURCE_DIR/"* "$TARGET_DIR/"
-    
-    print_success "Integration files synced successfully"
-    
+
+    print_status "Integration files are mounted from: $SOURCE_DIR"
+
     # Restart Home Assistant if container is running
     if podman ps -q -f name=dc | grep -q .; then
         print_status "Restarting Home Assistant container..."